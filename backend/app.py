@@ -9,18 +9,43 @@ IMPORTANT:
 - Resume path must ONLY be accessed via config.settings.resume_path
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Optional
 
-from fastapi import FastAPI, status
+import orjson
+from fastapi import FastAPI, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Import centralized logger FIRST
-from logger import setup_logging, get_logger
+from logger import (
+    setup_logging,
+    get_logger,
+    start_log_listener,
+    stop_log_listener,
+)
 
 # Import configuration
-from config import settings
+from config import (
+    settings,
+    invalidate_stat_cache,
+    start_resume_watcher,
+    stop_resume_watcher,
+)
 
 # Initialize logging before anything else
 setup_logging(
@@ -42,15 +67,271 @@ from models import (
     TailorResponse,
     HealthResponse,
     ErrorResponse,
+    GeneratedFile,
+    TAILOR_REQUEST_ADAPTER,
+    build_trusted,
+    dump_tailor_response,
 )
 from exceptions import (
     ResumeTailorException,
     ResumeNotFoundError,
+    ResumeParseError,
     GeminiAPIError,
     DocumentGenerationError,
     InvalidJobDescriptionError,
 )
 
+# Service submodules (PDF/DOCX libraries, the Gemini SDK) are only
+# imported the first time a service is built, not at app import
+import services
+
+if TYPE_CHECKING:
+    from services import ParsedResume, GeminiService, DocumentGenerator
+
+
+# ===========================================
+# Service Factories
+# ===========================================
+
+@lru_cache(maxsize=1)
+def _get_gemini(
+    api_key: str,
+    model: str,
+    semantic_cache_threshold: Optional[float] = None,
+    model_tiers: tuple[str, ...] = (),
+) -> "GeminiService":
+    """
+    Get a shared GeminiService instance.
+    
+    Client setup is the expensive part of a Gemini call, so the service
+    is built once and reused. Keyed on every setting it is built from so
+    a configuration change yields a fresh instance.
+    
+    Args:
+        api_key: Gemini API key (from config.settings.gemini_api_key)
+        model: Gemini model name (from config.settings.gemini_model)
+        semantic_cache_threshold: From config.settings.semantic_cache_threshold
+        model_tiers: From config.settings.gemini_model_tiers (as a tuple)
+        
+    Returns:
+        GeminiService: Shared service instance
+    """
+    return services.GeminiService(
+        api_key=api_key,
+        model=model,
+        semantic_cache_threshold=semantic_cache_threshold,
+        model_tiers=list(model_tiers),
+    )
+
+
+def _current_gemini() -> "GeminiService":
+    """Get the shared GeminiService for the current settings."""
+    return _get_gemini(
+        settings.gemini_api_key,
+        settings.gemini_model,
+        settings.semantic_cache_threshold,
+        tuple(settings.gemini_model_tiers or ()),
+    )
+
+
+def _parse_resume(resume_path: Path) -> "ParsedResume":
+    """
+    Parse the resume at the given path.
+    
+    Blocking (file I/O + text extraction); call via asyncio.to_thread.
+    
+    Args:
+        resume_path: Path to the resume (from config.settings.resume_path)
+        
+    Returns:
+        ParsedResume: Structured resume data
+    """
+    return services.ResumeParser(resume_path).parse()
+
+
+@lru_cache(maxsize=1)
+def _get_doc_generator(output_dir: Path) -> "DocumentGenerator":
+    """
+    Get a shared DocumentGenerator instance.
+    
+    Args:
+        output_dir: Output directory (from config.settings.output_dir)
+        
+    Returns:
+        DocumentGenerator: Shared generator instance
+    """
+    return services.DocumentGenerator(output_dir)
+
+
+# Max threads for blocking work offloaded from request handlers
+WORKER_THREADS = 16
+
+
+# ===========================================
+# Config Payload
+# ===========================================
+
+def _etag(payload: bytes) -> str:
+    """Strong ETag for a response body (blake2b is fast and in the stdlib)."""
+    return '"%s"' % hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _json_etag_response(request: Request, payload: bytes, etag: str) -> Response:
+    """
+    Send a pre-encoded JSON body, or an empty 304 if the client has it.
+    
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        payload: JSON-encoded response body
+        etag: ETag of payload
+        
+    Returns:
+        Response: 200 with the body, or 304 Not Modified
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    Encode a response model straight to JSON bytes with pydantic-core.
+    
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; response_model stays on the route for the docs.
+    
+    Args:
+        model: Response model instance
+        
+    Returns:
+        Response: application/json response
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _get_config_payload() -> tuple[bytes, str]:
+    """
+    Get the serialized /config response body and its ETag.
+    
+    Built (and JSON-encoded) once at startup and stored on app.state; only
+    rebuilt when settings.get_resume_info() hands back a new dict (i.e. the
+    resume file changed), since every other field is fixed for the
+    lifetime of the process.
+    
+    Returns:
+        tuple: (JSON-encoded non-sensitive configuration values, ETag)
+    """
+    resume_info = settings.get_resume_info()
+    
+    cached = getattr(app.state, "config_payload", None)
+    if cached is not None and cached[0] is resume_info:
+        return cached[1]
+    
+    payload = orjson.dumps({
+        "resume": {
+            "filename": resume_info["filename"],
+            "format": resume_info["format"],
+            "exists": resume_info["exists"],
+        },
+        "output_directory": str(settings.output_dir),
+        "supported_formats": ["pdf", "docx"],
+        "gemini_model": settings.gemini_model,
+        "debug_mode": settings.debug,
+        "log_level": settings.log_level,
+    })
+    result = (payload, _etag(payload))
+    app.state.config_payload = (resume_info, result)
+    return result
+
+
+def _get_resume_info_payload() -> tuple[dict, bytes, str]:
+    """
+    Get the serialized /resume/info response body and its ETag.
+    
+    Re-encoded only when settings.get_resume_info() returns a new dict.
+    
+    Returns:
+        tuple: (resume info dict, JSON-encoded body, ETag)
+    """
+    info = settings.get_resume_info()
+    
+    cached = getattr(app.state, "resume_info_payload", None)
+    if cached is not None and cached[0] is info:
+        return cached
+    
+    payload = orjson.dumps(info)
+    result = (info, payload, _etag(payload))
+    app.state.resume_info_payload = result
+    return result
+
+
+def _get_health_snapshot() -> tuple[str, dict[str, str]]:
+    """
+    Get the /health status and component checks.
+    
+    Stored on app.state and only rebuilt when the resume info or output
+    directory state changes, so a steady stream of probes costs a couple
+    of cache lookups.
+    
+    Returns:
+        tuple: (status string, checks dict)
+    """
+    resume_info = settings.get_resume_info()
+    output_dir_ok = settings.output_dir_exists()
+    
+    cached = getattr(app.state, "health_snapshot", None)
+    if cached is not None and cached[0] is resume_info and cached[1] == output_dir_ok:
+        return cached[2]
+    
+    resume_exists = resume_info["exists"]
+    gemini_configured = bool(settings.gemini_api_key)
+    
+    checks = {
+        "resume_file": "ok" if resume_exists else "missing",
+        "gemini_api": "configured" if gemini_configured else "not_configured",
+        "output_directory": "ok" if output_dir_ok else "missing",
+    }
+    status_str = "healthy" if resume_exists and gemini_configured else "degraded"
+    
+    snapshot = (status_str, checks)
+    app.state.health_snapshot = (resume_info, output_dir_ok, snapshot)
+    return snapshot
+
+
+@asynccontextmanager
+async def gemini_lifespan(app: FastAPI):
+    """
+    Warm up the shared Gemini client on startup.
+    
+    Client construction and the first API round-trip (TLS + auth) are
+    slow, so do them here instead of on the first /tailor request.
+    Failures are logged but never block startup.
+    """
+    app.state.gemini = None
+    
+    if settings.gemini_api_key:
+        logger.info("Warming up Gemini client...")
+        try:
+            app.state.gemini = await asyncio.to_thread(_current_gemini)
+            connected = await asyncio.to_thread(app.state.gemini.test_connection)
+            if connected:
+                logger.info("Gemini client ready")
+            else:
+                logger.warning("Gemini warmup request failed; will retry on first use")
+        except Exception as e:
+            logger.warning("Gemini warmup skipped: %s", e)
+    
+    yield
+    
+    app.state.gemini = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -59,26 +340,50 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
+    start_log_listener()
     logger.info("=" * 60)
     logger.info("Starting Resume Tailor API...")
     logger.info("=" * 60)
     
-    # Validate configuration
-    _validate_startup_config()
-    
-    # Create necessary directories
-    _ensure_directories()
+    # Bound the pool used by asyncio.to_thread for blocking work
+    # (resume parsing, Gemini calls, document generation)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="worker")
+    )
     
-    logger.info("Resume Tailor API started successfully")
-    logger.info(f"Server running at http://{settings.host}:{settings.port}")
-    logger.info(f"API Docs available at http://{settings.host}:{settings.port}/docs")
+    # Validate configuration (stats the resume file, so run off the loop)
+    await asyncio.to_thread(_validate_startup_config)
     
-    yield
+    # Create necessary directories
+    await _ensure_directories()
+    
+    # Serve resume info from cache until the resume directory changes
+    if start_resume_watcher(settings.resume_dir):
+        logger.info("Watching resume directory for changes: %s", settings.resume_dir)
+    else:
+        logger.debug("Resume directory watcher unavailable, using TTL stat cache")
+    
+    # Precompute static endpoint payloads
+    await asyncio.to_thread(_get_config_payload)
+    await asyncio.to_thread(_get_resume_info_payload)
+    await asyncio.to_thread(_get_health_snapshot)
+    
+    async with gemini_lifespan(app):
+        logger.info("Resume Tailor API started successfully")
+        logger.info("Server running at http://%s:%s", settings.host, settings.port)
+        logger.info("API Docs available at http://%s:%s/docs", settings.host, settings.port)
+        
+        yield
     
     # Shutdown
     logger.info("=" * 60)
     logger.info("Shutting down Resume Tailor API...")
     logger.info("=" * 60)
+    
+    stop_resume_watcher()
+    
+    # Flush queued log records before exit
+    stop_log_listener()
 
 
 def _validate_startup_config() -> None:
@@ -114,14 +419,14 @@ def _validate_startup_config() -> None:
     if settings.resume_filename:
         resume_info = settings.get_resume_info()
         if resume_info["exists"]:
-            logger.info(f"Resume file: {resume_info['filename']}")
-            logger.info(f"Resume format: {resume_info['format']}")
-            logger.info(f"Resume size: {resume_info['size_bytes']} bytes")
+            logger.info("Resume file: %s", resume_info['filename'])
+            logger.info("Resume format: %s", resume_info['format'])
+            logger.info("Resume size: %s bytes", resume_info['size_bytes'])
     
     # Log configuration summary
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"Log level: {settings.log_level}")
-    logger.info(f"Gemini model: {settings.gemini_model}")
+    logger.info("Debug mode: %s", settings.debug)
+    logger.info("Log level: %s", settings.log_level)
+    logger.info("Gemini model: %s", settings.gemini_model)
     
     # Fail on critical errors
     if critical_errors:
@@ -141,16 +446,20 @@ def _validate_startup_config() -> None:
     logger.info("Configuration validated successfully")
 
 
-def _ensure_directories() -> None:
-    """Create necessary directories if they don't exist."""
+async def _ensure_directories() -> None:
+    """Create necessary directories if they don't exist (in worker threads)."""
     directories = [
         ("outputs", settings.output_dir),
         ("logs", settings.logs_dir),
     ]
     
+    await asyncio.gather(*(
+        asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+        for _, directory in directories
+    ))
+    
     for name, directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured {name} directory exists: {directory}")
+        logger.debug("Ensured %s directory exists: %s", name, directory)
 
 
 # Initialize FastAPI application
@@ -159,6 +468,7 @@ app = FastAPI(
     description="AI-powered resume tailoring service using Google Gemini",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -166,11 +476,9 @@ app = FastAPI(
 # Configure CORS for Chrome Extension
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "chrome-extension://*",
-        "http://localhost:*",
-        "http://127.0.0.1:*",
-    ],
+    # Starlette does not expand wildcards inside allow_origins, so match
+    # extension and localhost origins (any port) with a regex instead
+    allow_origin_regex=r"^(chrome-extension://.+|https?://(localhost|127\.0\.0\.1)(:\d+)?)$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
@@ -182,36 +490,76 @@ app.add_middleware(
 # Exception Handlers
 # ===========================================
 
+def _error_payload(error: str, message: str, details: Optional[dict] = None) -> dict:
+    """
+    Build an error body matching the ErrorResponse schema.
+    
+    Error shapes are fixed, so the dict is assembled directly rather than
+    validating and dumping an ErrorResponse model on every error.
+    
+    Args:
+        error: Error code for programmatic handling
+        message: Human-readable error message
+        details: Additional error details
+        
+    Returns:
+        dict: JSON-serializable error body
+    """
+    return {
+        "error": error,
+        "message": message,
+        "details": details,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
 @app.exception_handler(ResumeTailorException)
 async def resume_tailor_exception_handler(request, exc: ResumeTailorException):
     """Handle custom application exceptions."""
     logger.error(
-        f"Application error: {exc.error_code} - {exc.message}",
+        "Application error: %s - %s",
+        exc.error_code,
+        exc.message,
         extra={"error_code": exc.error_code, "details": exc.details},
     )
-    error_response = ErrorResponse(
-        error=exc.error_code,
-        message=exc.message,
-        details=exc.details,
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content=_error_payload(exc.error_code, exc.message, exc.details),
     )
-    return JSONResponse(
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc: RequestValidationError):
+    """Return request validation errors in FastAPI's usual 422 shape, via orjson."""
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request, exc: StarletteHTTPException):
+    """Return HTTP errors (404 route, 405 method, ...) via orjson."""
+    if exc.status_code in (status.HTTP_204_NO_CONTENT, status.HTTP_304_NOT_MODIFIED):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(mode='json'),
+        content={"detail": exc.detail},
+        headers=exc.headers,
     )
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc: Exception):
     """Handle unexpected exceptions."""
-    logger.exception(f"Unexpected error: {str(exc)}")
-    error_response = ErrorResponse(
-        error="INTERNAL_ERROR",
-        message="An unexpected error occurred",
-        details={"error": str(exc)} if settings.debug else None,
-    )
-    return JSONResponse(
+    logger.exception("Unexpected error: %s", exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode='json'),
+        content=_error_payload(
+            "INTERNAL_ERROR",
+            "An unexpected error occurred",
+            {"error": str(exc)} if settings.debug else None,
+        ),
     )
 
 
@@ -226,125 +574,207 @@ async def global_exception_handler(request, exc: Exception):
     summary="Health Check",
     description="Check if the API is running and all dependencies are available",
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Perform health check on the API and its dependencies.
     
     Returns:
-        HealthResponse: Current health status of the service
+        Response: Current health status of the service (HealthResponse)
     """
     logger.debug("Health check requested")
     
-    # Access resume info through config
-    resume_info = settings.get_resume_info()
-    resume_exists = resume_info["exists"]
-    gemini_configured = bool(settings.gemini_api_key)
-    
-    is_healthy = resume_exists and gemini_configured
-    
-    checks = {
-        "resume_file": "ok" if resume_exists else "missing",
-        "gemini_api": "configured" if gemini_configured else "not_configured",
-        "output_directory": "ok" if settings.output_dir.exists() else "missing",
-    }
-    
-    status_str = "healthy" if is_healthy else "degraded"
-    logger.info(f"Health check: {status_str}", extra={"checks": checks})
+    # Filesystem state comes from the config stat cache
+    status_str, checks = _get_health_snapshot()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Health check: %s", status_str, extra={"checks": checks})
     
-    return HealthResponse(
+    return _model_response(build_trusted(
+        HealthResponse,
         status=status_str,
         version="1.0.0",
         checks=checks,
-    )
+    ))
 
 
-@app.post(
-    "/tailor",
-    response_model=TailorResponse,
-    tags=["Resume"],
-    summary="Tailor Resume",
-    description="Process a job description and generate a tailored resume",
-    responses={
-        200: {"description": "Resume tailored successfully"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        404: {"model": ErrorResponse, "description": "Resume not found"},
-        500: {"model": ErrorResponse, "description": "Internal server error"},
-        503: {"model": ErrorResponse, "description": "Gemini API unavailable"},
-    },
-)
-async def tailor_resume(request: TailorRequest) -> TailorResponse:
+async def _read_tailor_request(raw_request: Request) -> TailorRequest:
     """
-    Tailor the stored resume based on the provided job description.
+    Validate the raw /tailor body straight from JSON bytes.
     
-    This endpoint:
-    1. Reads the base resume from storage (via config.settings.resume_path)
-    2. Analyzes the job description
-    3. Uses Gemini AI to tailor the resume
-    4. Generates PDF and/or DOCX output files (Phase 4)
+    pydantic-core parses and validates in a single pass, skipping the
+    intermediate dict FastAPI would otherwise build for the (large)
+    job description. Errors are re-raised in FastAPI's 422 format.
     
     Args:
-        request: TailorRequest containing job description and options
+        raw_request: Incoming request
         
     Returns:
-        TailorResponse: Status and paths to generated files
+        TailorRequest: Validated request body
     """
-    import time
-    start_time = time.time()
+    body = await raw_request.body()
+    try:
+        return TAILOR_REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body)
+
+
+# Request body schema for the /tailor endpoints (the body is read and
+# validated manually, so FastAPI cannot infer it from the signature)
+_TAILOR_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": TailorRequest.model_json_schema()}},
+    },
+}
+
+
+async def _iterate_in_thread(factory: Callable[[], Iterator]) -> AsyncIterator:
+    """
+    Run a blocking iterator in a worker thread, yielding its items here.
     
-    logger.info(
-        f"Tailor request received",
-        extra={
-            "job_title": request.job_title or "Unknown",
-            "company": request.company or "Unknown",
-            "jd_length": len(request.job_description),
-            "output_formats": request.output_formats,
-        },
-    )
+    If the consumer stops early, the thread stops at the next item and
+    closes the iterator.
     
-    # Import services
-    from services.resume_parser import ResumeParser
-    from services.gemini_service import GeminiService
+    Args:
+        factory: Zero-argument callable returning the iterator to drain
+        
+    Yields:
+        The iterator's items, in order
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    done = object()
+    
+    def drain() -> None:
+        iterator = factory()
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, e))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, None))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
     
+    worker = asyncio.ensure_future(asyncio.to_thread(drain))
     try:
-        # Step 1: Parse the resume (path accessed via config)
-        logger.info(f"Parsing resume: {settings.resume_path}")
-        parser = ResumeParser(settings.resume_path)
-        parsed_resume = parser.parse()
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stop.set()
+        await worker
+
+
+async def _tailor_pipeline(
+    request: TailorRequest,
+    stream_sections: bool = False,
+) -> AsyncIterator[tuple[str, object]]:
+    """
+    Run the tailoring pipeline, reporting progress after each step.
+    
+    Yields (stage, data) pairs: "parsed", "tailored" and "generated" with
+    small progress dicts, then ("complete", TailorResponse) last. With
+    stream_sections, ("section", {"section", "text"}) pieces of the model
+    output are also yielded while Gemini generates it.
+    
+    Args:
+        request: Validated tailor request
+        stream_sections: Forward tailored text as it is generated
         
+    Yields:
+        tuple: (stage name, stage data)
+    """
+    start_ns = time.perf_counter_ns()
+    resume_path = settings.resume_path
+    
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            f"Resume parsed: {parsed_resume.word_count} words, "
-            f"{len(parsed_resume.skills)} skills found"
+            "Tailor request received",
+            extra={
+                "job_title": request.job_title or "Unknown",
+                "company": request.company or "Unknown",
+                "jd_length": len(request.job_description),
+                "output_formats": request.output_formats,
+            },
+        )
+    
+    try:
+        # Step 1 & 2: Parse the resume (path accessed via config) and get the
+        # shared Gemini service concurrently in worker threads
+        logger.info("Parsing resume: %s", resume_path)
+        parsed_resume, gemini = await asyncio.gather(
+            asyncio.to_thread(_parse_resume, resume_path),
+            asyncio.to_thread(_current_gemini),
         )
         
-        # Step 2: Initialize Gemini service and tailor the resume
-        logger.info("Initializing Gemini service...")
-        gemini = GeminiService(
-            api_key=settings.gemini_api_key,
-            model=settings.gemini_model
+        logger.info(
+            "Resume parsed: %s words, %s skills found",
+            parsed_resume.word_count,
+            len(parsed_resume.skills),
         )
         
+        # An image-only resume has no text worth sending to Gemini
+        if parsed_resume.needs_ocr:
+            raise ResumeParseError(
+                filename=settings.resume_filename,
+                reason="resume appears to be scanned; OCR required",
+            )
+        
+        yield "parsed", {
+            "word_count": parsed_resume.word_count,
+            "skills_found": len(parsed_resume.skills),
+        }
+        
         # Step 3: Tailor the resume using AI
         logger.info("Tailoring resume with Gemini AI...")
-        tailored = gemini.tailor_resume(
-            resume_text=parsed_resume.raw_text,
-            job_description=request.job_description,
-            job_title=request.job_title,
-            company=request.company,
-            emphasis_keywords=request.emphasis_keywords,
-        )
+        tailor_args = {
+            "resume_text": parsed_resume.raw_text,
+            "job_description": request.job_description,
+            "job_title": request.job_title,
+            "company": request.company,
+            "emphasis_keywords": request.emphasis_keywords,
+        }
+        if stream_sections:
+            tailored = None
+            async for tag, piece in _iterate_in_thread(
+                lambda: gemini.tailor_resume_stream(**tailor_args)
+            ):
+                if tag == "complete":
+                    tailored = piece
+                else:
+                    yield "section", {"section": tag, "text": piece}
+        else:
+            tailored = await gemini.tailor_resume_async(**tailor_args)
+        yield "tailored", {
+            "ats_score": tailored.ats_score,
+            "keywords_matched": tailored.matched_keywords,
+        }
         
         # Step 4: Generate documents
-        logger.info(f"Generating documents in formats: {request.output_formats}")
-        from services.document_gen import DocumentGenerator
-        
-        doc_generator = DocumentGenerator(settings.output_dir)
+        logger.info("Generating documents in formats: %s", request.output_formats)
+        doc_generator = _get_doc_generator(settings.output_dir)
         
         # Get candidate name from parsed resume
         candidate_name = None
         if parsed_resume.contact_info and parsed_resume.contact_info.name:
             candidate_name = parsed_resume.contact_info.name
         
-        generated_docs = doc_generator.generate(
+        generated_docs = await asyncio.to_thread(
+            doc_generator.generate,
             content=tailored.tailored_text,
             formats=request.output_formats,
             job_title=request.job_title,
@@ -352,10 +782,11 @@ async def tailor_resume(request: TailorRequest) -> TailorResponse:
             candidate_name=candidate_name,
         )
         
-        # Convert to response model
-        from models import GeneratedFile
+        # Convert to response model. All values come from our own services
+        # and are already correctly typed, so skip re-validation.
         files_generated = [
-            GeneratedFile(
+            build_trusted(
+                GeneratedFile,
                 filename=doc.filename,
                 format=doc.format,
                 path=str(doc.path),
@@ -364,11 +795,13 @@ async def tailor_resume(request: TailorRequest) -> TailorResponse:
             )
             for doc in generated_docs
         ]
+        yield "generated", {"files": [f.filename for f in files_generated]}
         
         # Calculate processing time
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
-        response = TailorResponse(
+        response = build_trusted(
+            TailorResponse,
             status="success",
             message=tailored.summary or "Resume tailored successfully",
             job_title=request.job_title,
@@ -383,55 +816,162 @@ async def tailor_resume(request: TailorRequest) -> TailorResponse:
         )
         
         logger.info(
-            f"Tailor request completed in {processing_time_ms}ms. "
-            f"Generated {len(files_generated)} files, "
-            f"Matched {len(tailored.matched_keywords)} keywords, "
-            f"ATS score: {tailored.ats_score}"
+            "Tailor request completed in %sms. "
+            "Generated %s files, Matched %s keywords, ATS score: %s",
+            processing_time_ms,
+            len(files_generated),
+            len(tailored.matched_keywords),
+            tailored.ats_score,
         )
         
-        return response
+        # Resume may have been replaced while we were processing
+        invalidate_stat_cache()
+        
+        yield "complete", response
         
     except FileNotFoundError as e:
-        logger.error(f"Resume file not found: {e}")
+        logger.error("Resume file not found: %s", e)
         raise ResumeNotFoundError(
             filename=settings.resume_filename,
-            path=str(settings.resume_path)
+            path=str(resume_path)
         )
     except Exception as e:
-        logger.exception(f"Error tailoring resume: {e}")
+        logger.exception("Error tailoring resume: %s", e)
         raise
 
 
+@app.post(
+    "/tailor",
+    response_model=TailorResponse,
+    tags=["Resume"],
+    summary="Tailor Resume",
+    description="Process a job description and generate a tailored resume",
+    responses={
+        200: {"description": "Resume tailored successfully"},
+        400: {"model": ErrorResponse, "description": "Invalid request"},
+        404: {"model": ErrorResponse, "description": "Resume not found"},
+        422: {"model": ErrorResponse, "description": "Resume could not be parsed"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+        503: {"model": ErrorResponse, "description": "Gemini API unavailable"},
+    },
+    openapi_extra=_TAILOR_REQUEST_BODY,
+)
+async def tailor_resume(raw_request: Request) -> Response:
+    """
+    Tailor the stored resume based on the provided job description.
+    
+    This endpoint:
+    1. Reads the base resume from storage (via config.settings.resume_path)
+    2. Analyzes the job description
+    3. Uses Gemini AI to tailor the resume
+    4. Generates PDF and/or DOCX output files (Phase 4)
+    
+    Args:
+        raw_request: Incoming request whose JSON body is a TailorRequest
+        
+    Returns:
+        Response: Status and paths to generated files (TailorResponse)
+    """
+    request = await _read_tailor_request(raw_request)
+    
+    # aclosing finalizes the pipeline as soon as we return, not at GC time
+    async with aclosing(_tailor_pipeline(request)) as pipeline:
+        async for stage, data in pipeline:
+            if stage == "complete":
+                return Response(
+                    content=dump_tailor_response(data),
+                    media_type="application/json",
+                )
+    
+    raise RuntimeError("Tailoring pipeline ended without a complete event")
+
+
+def _ndjson_event(stage: str, data: object) -> bytes:
+    """Encode one progress event as a newline-terminated JSON line."""
+    return orjson.dumps({"stage": stage, "data": data}) + b"\n"
+
+
+def _ndjson_complete_event(response: TailorResponse) -> bytes:
+    """Encode the final event, splicing in the pre-serialized response."""
+    return b'{"stage":"complete","data":' + dump_tailor_response(response) + b"}\n"
+
+
+@app.post(
+    "/tailor/stream",
+    tags=["Resume"],
+    summary="Tailor Resume (Streaming)",
+    description=(
+        "Same as /tailor, but streams newline-delimited JSON progress events "
+        "as each step finishes, plus 'section' events with the tailored text "
+        "as Gemini generates it. The last event is 'complete' (TailorResponse) "
+        "or 'error' (ErrorResponse)."
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra=_TAILOR_REQUEST_BODY,
+)
+async def tailor_resume_stream(raw_request: Request) -> StreamingResponse:
+    """
+    Tailor the stored resume, streaming progress as it happens.
+    
+    The body is validated before streaming starts, so invalid requests
+    still get a normal 422. Errors after that point are reported as a
+    final "error" event, since the 200 status has already been sent.
+    Generated files are fetched afterwards via /download, which streams
+    them from disk.
+    
+    Args:
+        raw_request: Incoming request whose JSON body is a TailorRequest
+        
+    Returns:
+        StreamingResponse: application/x-ndjson progress events
+    """
+    request = await _read_tailor_request(raw_request)
+    
+    async def events() -> AsyncIterator[bytes]:
+        yield _ndjson_event("accepted", {"output_formats": request.output_formats})
+        try:
+            async with aclosing(_tailor_pipeline(request, stream_sections=True)) as pipeline:
+                async for stage, data in pipeline:
+                    if stage == "complete":
+                        yield _ndjson_complete_event(data)
+                    else:
+                        yield _ndjson_event(stage, data)
+        except ResumeTailorException as e:
+            logger.error("Application error: %s - %s", e.error_code, e.message)
+            yield _ndjson_event("error", _error_payload(e.error_code, e.message, e.details))
+        except Exception as e:
+            yield _ndjson_event("error", _error_payload(
+                "INTERNAL_ERROR",
+                "An unexpected error occurred",
+                {"error": str(e)} if settings.debug else None,
+            ))
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @app.get(
     "/config",
     tags=["Configuration"],
     summary="Get Current Configuration",
     description="Retrieve non-sensitive configuration details",
 )
-async def get_config():
+async def get_config(request: Request):
     """
     Get current configuration (non-sensitive values only).
     
+    Supports conditional requests: a matching If-None-Match gets a 304.
+    
+    Args:
+        request: Incoming request
+        
     Returns:
-        dict: Current configuration settings
+        Response: Current configuration settings as pre-encoded JSON
     """
     logger.debug("Configuration requested")
     
-    # Get resume info through config
-    resume_info = settings.get_resume_info()
-    
-    return {
-        "resume": {
-            "filename": resume_info["filename"],
-            "format": resume_info["format"],
-            "exists": resume_info["exists"],
-        },
-        "output_directory": str(settings.output_dir),
-        "supported_formats": ["pdf", "docx"],
-        "gemini_model": settings.gemini_model,
-        "debug_mode": settings.debug,
-        "log_level": settings.log_level,
-    }
+    payload, etag = _get_config_payload()
+    return _json_etag_response(request, payload, etag)
 
 
 @app.get(
@@ -440,23 +980,27 @@ async def get_config():
     summary="Get Resume Information",
     description="Get information about the configured resume file",
 )
-async def get_resume_info():
+async def get_resume_info(request: Request):
     """
     Get information about the currently configured resume.
     
-    Resume path is accessed ONLY through settings.
+    Resume path is accessed ONLY through settings. Supports conditional
+    requests: a matching If-None-Match gets a 304.
     
+    Args:
+        request: Incoming request
+        
     Returns:
-        dict: Resume file information
+        Response: Resume file information as pre-encoded JSON
     """
     logger.debug("Resume info requested")
     
-    # All resume access through config
-    info = settings.get_resume_info()
+    # All resume access through config (cached)
+    info, payload, etag = _get_resume_info_payload()
     
-    logger.info(f"Resume info: {info['filename']} (exists: {info['exists']})")
+    logger.info("Resume info: %s (exists: %s)", info['filename'], info['exists'])
     
-    return info
+    return _json_etag_response(request, payload, etag)
 
 
 @app.get(
@@ -479,12 +1023,10 @@ async def parse_resume():
         dict: Parsed resume data
     """
     logger.info("Resume parse requested")
-    
-    from services.resume_parser import ResumeParser
+    resume_path = settings.resume_path
     
     try:
-        parser = ResumeParser(settings.resume_path)
-        parsed = parser.parse()
+        parsed = await asyncio.to_thread(_parse_resume, resume_path)
         
         return {
             "status": "success",
@@ -493,13 +1035,13 @@ async def parse_resume():
         }
         
     except FileNotFoundError as e:
-        logger.error(f"Resume file not found: {e}")
+        logger.error("Resume file not found: %s", e)
         raise ResumeNotFoundError(
             filename=settings.resume_filename,
-            path=str(settings.resume_path)
+            path=str(resume_path)
         )
     except Exception as e:
-        logger.exception(f"Error parsing resume: {e}")
+        logger.exception("Error parsing resume: %s", e)
         raise
 
 
@@ -527,18 +1069,13 @@ async def extract_job_details(job_description: str):
     """
     logger.info("Job extraction requested")
     
-    from services.gemini_service import GeminiService
-    
     if len(job_description) < 50:
         raise InvalidJobDescriptionError("Job description too short (minimum 50 characters)")
     
     try:
-        gemini = GeminiService(
-            api_key=settings.gemini_api_key,
-            model=settings.gemini_model
-        )
+        gemini = await asyncio.to_thread(_current_gemini)
         
-        details = gemini.extract_job_details(job_description)
+        details = await gemini.extract_job_details_async(job_description)
         
         return {
             "status": "success",
@@ -546,7 +1083,7 @@ async def extract_job_details(job_description: str):
         }
         
     except Exception as e:
-        logger.exception(f"Error extracting job details: {e}")
+        logger.exception("Error extracting job details: %s", e)
         raise
 
 
@@ -565,8 +1102,6 @@ async def test_gemini():
     """
     logger.info("Gemini connection test requested")
     
-    from services.gemini_service import GeminiService
-    
     if not settings.gemini_api_key:
         return {
             "status": "error",
@@ -575,12 +1110,9 @@ async def test_gemini():
         }
     
     try:
-        gemini = GeminiService(
-            api_key=settings.gemini_api_key,
-            model=settings.gemini_model
-        )
+        gemini = await asyncio.to_thread(_current_gemini)
         
-        connected = gemini.test_connection()
+        connected = await asyncio.to_thread(gemini.test_connection)
         
         return {
             "status": "success" if connected else "error",
@@ -590,7 +1122,7 @@ async def test_gemini():
         }
         
     except Exception as e:
-        logger.error(f"Gemini connection test failed: {e}")
+        logger.error("Gemini connection test failed: %s", e)
         return {
             "status": "error",
             "message": str(e),
@@ -598,6 +1130,13 @@ async def test_gemini():
         }
 
 
+# Media types for generated documents, keyed by file extension
+_MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
 @app.get(
     "/download/{filename}",
     tags=["Files"],
@@ -614,27 +1153,30 @@ async def download_file(filename: str):
     Returns:
         FileResponse: The requested file
     """
-    from fastapi.responses import FileResponse
-    
-    logger.info(f"Download requested: {filename}")
+    logger.info("Download requested: %s", filename)
     
     file_path = settings.output_dir / filename
     
-    if not file_path.exists():
-        logger.warning(f"File not found: {filename}")
+    # Stat once here and hand the result to FileResponse so it does not
+    # stat the file again before streaming it
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        stat_result = None
+    
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        logger.warning("File not found: %s", filename)
         raise ResumeNotFoundError(filename=filename, path=str(file_path))
     
-    # Determine media type
-    media_type = "application/octet-stream"
-    if filename.endswith('.pdf'):
-        media_type = "application/pdf"
-    elif filename.endswith('.docx'):
-        media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    media_type = _MEDIA_TYPES.get(
+        os.path.splitext(filename)[1].lower(), "application/octet-stream"
+    )
     
     return FileResponse(
         path=file_path,
         filename=filename,
         media_type=media_type,
+        stat_result=stat_result,
     )
 
 
@@ -653,9 +1195,7 @@ async def list_files():
     """
     logger.debug("File listing requested")
     
-    from services.document_gen import DocumentGenerator
-    
-    doc_generator = DocumentGenerator(settings.output_dir)
+    doc_generator = _get_doc_generator(settings.output_dir)
     files = doc_generator.list_generated_files()
     
     return {
@@ -671,7 +1211,7 @@ async def list_files():
     summary="Cleanup Old Files",
     description="Remove old generated files",
 )
-async def cleanup_files(keep_count: int = 10):
+async def cleanup_files(keep_count: int = Query(10, ge=0)):
     """
     Remove old generated files, keeping only recent ones.
     
@@ -681,11 +1221,9 @@ async def cleanup_files(keep_count: int = 10):
     Returns:
         dict: Cleanup result
     """
-    logger.info(f"File cleanup requested, keeping {keep_count} files")
-    
-    from services.document_gen import DocumentGenerator
+    logger.info("File cleanup requested, keeping %s files", keep_count)
     
-    doc_generator = DocumentGenerator(settings.output_dir)
+    doc_generator = _get_doc_generator(settings.output_dir)
     deleted = doc_generator.cleanup_old_files(keep_count)
     
     return {
@@ -700,14 +1238,27 @@ async def cleanup_files(keep_count: int = 10):
 # ===========================================
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+    
     import uvicorn
     
-    logger.info(f"Starting server on {settings.host}:{settings.port}")
+    # C event loop and HTTP parser when available (uvloop has no Windows build)
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    workers = settings.worker_count
+    
+    logger.info(
+        "Starting server on %s:%s (loop=%s, http=%s, workers=%s)",
+        settings.host, settings.port, loop, http, workers,
+    )
     
     uvicorn.run(
         "app:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=None if settings.debug else workers,
+        loop=loop,
+        http=http,
         log_level=settings.log_level.lower(),
     )
\ No newline at end of file
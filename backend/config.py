@@ -8,19 +8,117 @@ IMPORTANT: All file paths, especially resume paths, must be accessed
 through this configuration module. Never hardcode paths.
 """
 
-from functools import lru_cache
+import os
+import re
+import stat
+import threading
+import time
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional: fall back to TTL-only stat caching
+    FileSystemEventHandler = object
+    Observer = None
+
 
 class ConfigurationError(Exception):
     """Raised when there's a configuration problem."""
     pass
 
 
+# Startup errors that must stop the app (others, like a missing API key, are warnings)
+_CRITICAL_RE = re.compile(r"RESUME_FILENAME|not found|Invalid resume")
+
+
+# ===========================================
+# Filesystem Stat Cache
+# ===========================================
+
+# Seconds a stat snapshot is trusted before the filesystem is checked again.
+# Only applies to the resume info while no resume directory watcher is running.
+STAT_CACHE_TTL = 1.0
+
+# (checked_at, (path, st_mtime_ns, st_size), info) for the last resume lookup
+_resume_info_cache: Optional[tuple[float, tuple, dict]] = None
+
+# path -> (checked_at, is_dir)
+_dir_exists_cache: dict[str, tuple[float, bool]] = {}
+
+# Bumped by every invalidation. A lookup only stores its result if no
+# invalidation happened while it was stat'ing, so a change event that
+# races with a lookup can't be overwritten by the old file's info.
+_stat_generation = 0
+_stat_lock = threading.Lock()
+
+
+# Running watchdog observer on the resume directory (None if not watching)
+_resume_observer = None
+
+
+def invalidate_stat_cache() -> None:
+    """Drop cached stat results so the next lookup hits the filesystem."""
+    global _resume_info_cache, _stat_generation
+    with _stat_lock:
+        _stat_generation += 1
+        _resume_info_cache = None
+        _dir_exists_cache.clear()
+
+
+class _InvalidateOnChange(FileSystemEventHandler):
+    """Watchdog handler that marks the stat cache dirty on any change."""
+    
+    def on_any_event(self, event) -> None:
+        invalidate_stat_cache()
+
+
+def start_resume_watcher(resume_dir: Path) -> bool:
+    """
+    Watch the resume directory and invalidate the stat cache on changes.
+    
+    While the watcher runs, cached resume info is served until a file
+    event arrives instead of expiring every STAT_CACHE_TTL.
+    
+    Args:
+        resume_dir: Directory holding the base resume
+        
+    Returns:
+        bool: True if the watcher is running, False if watchdog is not
+            installed or the directory does not exist
+    """
+    global _resume_observer
+    
+    if _resume_observer is not None:
+        return True
+    if Observer is None or not os.path.isdir(resume_dir):
+        return False
+    
+    observer = Observer()
+    observer.schedule(_InvalidateOnChange(), str(resume_dir), recursive=False)
+    observer.daemon = True
+    observer.start()
+    
+    invalidate_stat_cache()
+    _resume_observer = observer
+    return True
+
+
+def stop_resume_watcher() -> None:
+    """Stop the resume directory watcher, if running."""
+    global _resume_observer
+    
+    observer, _resume_observer = _resume_observer, None
+    if observer is not None:
+        observer.stop()
+        observer.join(timeout=2)
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -53,6 +151,26 @@ class Settings(BaseSettings):
         description="Gemini model to use for content generation",
     )
     
+    gemini_model_tiers: Optional[list[str]] = Field(
+        default=None,
+        description=(
+            "Cheaper models to route shorter tailoring prompts to, cheapest "
+            "first (JSON list); gemini_model stays the top tier. Unset sends "
+            "every request to gemini_model"
+        ),
+    )
+    
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Reuse a cached tailoring result when a new prompt's embedding "
+            "similarity reaches this value (requires faiss-cpu and "
+            "sentence-transformers; disabled when unset)"
+        ),
+    )
+    
     # ===========================================
     # Resume Configuration (via .env ONLY)
     # ===========================================
@@ -88,6 +206,12 @@ class Settings(BaseSettings):
         description="Enable debug mode with auto-reload and verbose errors",
     )
     
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Uvicorn worker processes (default: 1; always 1 in debug mode)",
+    )
+    
     # ===========================================
     # Logging Configuration
     # ===========================================
@@ -134,8 +258,10 @@ class Settings(BaseSettings):
     # ===========================================
     # Computed Properties (Path Access)
     # ===========================================
+    # Cached per instance: settings are not mutated after load, and these
+    # are read on every request.
     
-    @property
+    @cached_property
     def resume_dir(self) -> Path:
         """
         Path to the resume storage directory.
@@ -144,7 +270,7 @@ class Settings(BaseSettings):
         """
         return self.base_dir / self.resume_dir_name
     
-    @property
+    @cached_property
     def resume_path(self) -> Path:
         """
         Full path to the resume file.
@@ -157,45 +283,120 @@ class Settings(BaseSettings):
         """
         return self.resume_dir / self.resume_filename
     
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         """Path to the output directory for generated files."""
         return self.base_dir / "backend" / "outputs"
     
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Path to the logs directory."""
         return self.base_dir / "backend" / "logs"
     
+    @property
+    def worker_count(self) -> int:
+        """
+        Number of server worker processes.
+        
+        Reload mode (debug) only supports a single worker. Defaults to one
+        because each worker rotates the same log files and runs its own
+        startup checks and resume watcher.
+        Configured via .env: WORKERS
+        """
+        if self.debug:
+            return 1
+        return self.workers
+    
     # ===========================================
     # Helper Methods
     # ===========================================
     
+    def _stat_resume(self) -> tuple[Path, Optional[os.stat_result]]:
+        """
+        Stat the resume file once.
+        
+        Returns:
+            tuple: (resume path, stat result or None if missing / not a regular file)
+        """
+        path = self.resume_path
+        try:
+            st = os.stat(path)
+        except OSError:
+            return path, None
+        return path, st if stat.S_ISREG(st.st_mode) else None
+    
     def get_resume_info(self) -> dict:
         """
         Get resume file information.
         
+        The file is stat'ed at most once per STAT_CACHE_TTL, or only after a
+        change event while the resume directory watcher runs. The returned
+        dict is reused (same object) for as long as the file's path, mtime
+        and size are unchanged, so callers can key derived caches on it.
+        
         Returns:
             dict: Resume file metadata
         """
+        global _resume_info_cache
+        
+        now = time.monotonic()
+        generation = _stat_generation
+        cached = _resume_info_cache
+        if cached is not None and (
+            _resume_observer is not None or now - cached[0] < STAT_CACHE_TTL
+        ):
+            return cached[2]
+        
         if not self.resume_filename:
-            return {
+            key = (None, None, None)
+        else:
+            path, st = self._stat_resume()
+            if st is not None:
+                key = (str(path), st.st_mtime_ns, st.st_size)
+            else:
+                key = (str(path), None, None)
+        
+        if cached is not None and cached[1] == key:
+            info = cached[2]
+        elif key[0] is None:
+            info = {
                 "filename": None,
                 "path": None,
                 "exists": False,
                 "format": None,
                 "size_bytes": None,
             }
+        else:
+            exists = key[2] is not None
+            info = {
+                "filename": self.resume_filename,
+                "path": key[0],
+                "exists": exists,
+                "format": self.resume_path.suffix.lower() if exists else None,
+                "size_bytes": key[2],
+            }
         
-        path = self.resume_path
-        exists = path.exists()
-        return {
-            "filename": self.resume_filename,
-            "path": str(path),
-            "exists": exists,
-            "format": path.suffix.lower() if exists else None,
-            "size_bytes": path.stat().st_size if exists else None,
-        }
+        with _stat_lock:
+            if _stat_generation == generation:
+                _resume_info_cache = (now, key, info)
+        return info
+    
+    def output_dir_exists(self) -> bool:
+        """
+        Check whether the output directory exists (cached for STAT_CACHE_TTL).
+        
+        Returns:
+            bool: True if the output directory is present
+        """
+        path = str(self.output_dir)
+        now = time.monotonic()
+        cached = _dir_exists_cache.get(path)
+        if cached is not None and now - cached[0] < STAT_CACHE_TTL:
+            return cached[1]
+        
+        exists = os.path.isdir(path)
+        _dir_exists_cache[path] = (now, exists)
+        return exists
     
     def validate_for_startup(self) -> list[str]:
         """
@@ -216,18 +417,19 @@ class Settings(BaseSettings):
             )
         else:
             # Check resume file exists
-            if not self.resume_path.exists():
+            resume_path, st = self._stat_resume()
+            if st is None:
                 errors.append(
-                    f"Resume file not found: {self.resume_path}\n"
+                    f"Resume file not found: {resume_path}\n"
                     f"  → Place your resume in: {self.resume_dir}/\n"
                     f"  → Or update RESUME_FILENAME in .env"
                 )
             else:
                 # Check file extension
                 valid_extensions = {".pdf", ".docx", ".doc"}
-                if self.resume_path.suffix.lower() not in valid_extensions:
+                if resume_path.suffix.lower() not in valid_extensions:
                     errors.append(
-                        f"Invalid resume format: {self.resume_path.suffix}\n"
+                        f"Invalid resume format: {resume_path.suffix}\n"
                         f"  → Supported formats: {', '.join(valid_extensions)}"
                     )
         
@@ -251,7 +453,7 @@ class Settings(BaseSettings):
         errors = self.validate_for_startup()
         
         # Filter to only critical errors (not warnings like missing API key)
-        critical_errors = [e for e in errors if "RESUME_FILENAME" in e or "not found" in e or "Invalid resume" in e]
+        critical_errors = [e for e in errors if _CRITICAL_RE.search(e)]
         
         if critical_errors:
             error_msg = "Configuration errors:\n\n" + "\n\n".join(critical_errors)
@@ -267,19 +469,18 @@ class Settings(BaseSettings):
         return {
             "gemini_api_key": bool(self.gemini_api_key),
             "resume_filename_set": bool(self.resume_filename),
-            "resume_file_exists": self.resume_path.exists() if self.resume_filename else False,
+            "resume_file_exists": self._stat_resume()[1] is not None if self.resume_filename else False,
             "output_dir": self.output_dir.exists() or True,  # Will be created
             "logs_dir": self.logs_dir.exists() or True,  # Will be created
         }
 
 
-@lru_cache
 def get_settings() -> Settings:
     """
-    Get cached settings instance.
+    Get the shared settings instance.
     
-    Uses lru_cache to ensure settings are only loaded once
-    and reused across the application.
+    Settings are loaded once at import time into the module-level
+    `settings`; this just returns it (e.g. for FastAPI dependencies).
     
     NOTE: This does NOT validate configuration. Call settings.validate_for_startup()
     or settings.validate_or_raise() during app startup.
@@ -287,23 +488,26 @@ def get_settings() -> Settings:
     Returns:
         Settings: Application settings instance
     """
-    return Settings()
+    return settings
 
 
 def reload_settings() -> Settings:
     """
     Force reload settings from .env file.
     
-    Clears the cache and reloads configuration.
+    Replaces the module-level instance with a freshly loaded one.
+    Modules that did `from config import settings` keep the old object.
     Use sparingly - mainly for testing.
     
     Returns:
         Settings: Fresh settings instance
     """
-    get_settings.cache_clear()
-    return get_settings()
+    global settings
+    invalidate_stat_cache()
+    settings = Settings()
+    return settings
 
 
 # Global settings instance for easy import
 # Usage: from config import settings
-settings = get_settings()
+settings = Settings()
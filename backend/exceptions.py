@@ -13,6 +13,10 @@ from config import ConfigurationError
 class ResumeTailorException(Exception):
     """Base exception for all Resume Tailor application errors."""
     
+    # Fixed attribute set; subclasses declare empty __slots__ so instances
+    # never allocate a __dict__
+    __slots__ = ("message", "error_code", "status_code", "details")
+    
     def __init__(
         self,
         message: str,
@@ -30,6 +34,8 @@ class ResumeTailorException(Exception):
 class ResumeNotFoundError(ResumeTailorException):
     """Raised when the resume file cannot be found."""
     
+    __slots__ = ()
+    
     def __init__(self, filename: str, path: str):
         super().__init__(
             message=f"Resume file not found: {filename}",
@@ -42,6 +48,8 @@ class ResumeNotFoundError(ResumeTailorException):
 class ResumeParseError(ResumeTailorException):
     """Raised when the resume file cannot be parsed."""
     
+    __slots__ = ()
+    
     def __init__(self, filename: str, reason: str):
         super().__init__(
             message=f"Failed to parse resume: {reason}",
@@ -54,6 +62,8 @@ class ResumeParseError(ResumeTailorException):
 class GeminiAPIError(ResumeTailorException):
     """Raised when Gemini API call fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, api_error: Optional[str] = None):
         super().__init__(
             message=f"Gemini API error: {message}",
@@ -66,6 +76,8 @@ class GeminiAPIError(ResumeTailorException):
 class GeminiRateLimitError(GeminiAPIError):
     """Raised when Gemini API rate limit is exceeded."""
     
+    __slots__ = ()
+    
     def __init__(self, retry_after: Optional[int] = None):
         super().__init__(
             message="Gemini API rate limit exceeded. Please try again later.",
@@ -80,6 +92,8 @@ class GeminiRateLimitError(GeminiAPIError):
 class DocumentGenerationError(ResumeTailorException):
     """Raised when document generation fails."""
     
+    __slots__ = ()
+    
     def __init__(self, format: str, reason: str):
         super().__init__(
             message=f"Failed to generate {format.upper()} document: {reason}",
@@ -92,6 +106,8 @@ class DocumentGenerationError(ResumeTailorException):
 class InvalidJobDescriptionError(ResumeTailorException):
     """Raised when the job description is invalid or too short."""
     
+    __slots__ = ()
+    
     def __init__(self, reason: str):
         super().__init__(
             message=f"Invalid job description: {reason}",
@@ -5,13 +5,23 @@ Provides consistent, structured logging across the entire application.
 All modules should import and use this logger instead of creating their own.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 
@@ -26,6 +36,10 @@ class LogConfig:
     MAX_BYTES = 10 * 1024 * 1024  # 10 MB
     BACKUP_COUNT = 5
     
+    # Buffered file writes
+    BUFFER_FLUSH_BYTES = 64 * 1024  # 64 KB
+    BUFFER_FLUSH_INTERVAL = 0.5  # seconds
+    
     # Formats
     CONSOLE_FORMAT = "%(asctime)s │ %(levelname)-8s │ %(name)-20s │ %(message)s"
     FILE_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s"
@@ -51,16 +65,101 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt: str, datefmt: str, use_colors: bool = True):
         super().__init__(fmt, datefmt)
         self.use_colors = use_colors
+        
+        # Colored level names are fixed, so build them once
+        self._colored_levels = {
+            level: f"{color}{logging.getLevelName(level)}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
     
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_colors:
-            color = self.COLORS.get(record.levelno, self.RESET)
-            record.levelname = f"{color}{record.levelname}{self.RESET}"
+        if not self.use_colors:
+            return super().format(record)
+        
+        # Color a temporary view of the record and restore it afterwards, so
+        # ANSI codes never leak into other handlers formatting the same record
+        levelname, name = record.levelname, record.name
+        record.levelname = self._colored_levels.get(
+            record.levelno, f"{self.RESET}{levelname}{self.RESET}"
+        )
+        
+        # Highlight logger name
+        record.name = f"{self.BOLD}{name}{self.RESET}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname, record.name = levelname, name
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that batches writes.
+    
+    Formatted records are collected in memory and written out in one
+    call once the buffer exceeds flush_bytes, or after flush_interval
+    seconds via a timer, instead of one write() per record.
+    """
+    
+    def __init__(
+        self,
+        *args,
+        flush_bytes: int = LogConfig.BUFFER_FLUSH_BYTES,
+        flush_interval: float = LogConfig.BUFFER_FLUSH_INTERVAL,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._buffered_size = 0
+        self._timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            self._buffer.append(msg)
+            self._buffered_size += len(msg)
             
-            # Highlight logger name
-            record.name = f"{self.BOLD}{record.name}{self.RESET}"
+            if self._buffered_size >= self.flush_bytes:
+                self._write_buffer()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        except Exception:
+            self.handleError(record)
+    
+    def _write_buffer(self) -> None:
+        """Write buffered records to disk, rotating first if needed."""
+        if not self._buffer:
+            return
+        
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_size = 0
+        
+        if self.stream is None:
+            self.stream = self._open()
+        
+        if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+            self.doRollover()
         
-        return super().format(record)
+        self.stream.write(data)
+        self.stream.flush()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write_buffer()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self.flush()
+        super().close()
 
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
@@ -69,8 +168,11 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
     def add_fields(self, log_record: dict, record: logging.LogRecord, message_dict: dict):
         super().add_fields(log_record, record, message_dict)
         
-        # Add timestamp in ISO format
-        log_record["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        # Add timestamp in ISO format (UTC), taken from the record itself
+        log_record["timestamp"] = "%s.%03dZ" % (
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)),
+            record.msecs,
+        )
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
         log_record["module"] = record.module
@@ -79,14 +181,24 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         
         # Add service identifier
         log_record["service"] = "resume-tailor"
+    
+    def jsonify_log_record(self, log_record: dict) -> str:
+        """Serialize with orjson; anything it can't encode natively falls back to str()."""
+        return orjson.dumps(log_record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Shared formatters: they hold no per-handler state, so every file
+# handler reuses the same instance instead of re-parsing the format
+_FILE_FORMATTER = logging.Formatter(LogConfig.FILE_FORMAT, LogConfig.DATE_FORMAT)
+_JSON_FORMATTER = CustomJsonFormatter(LogConfig.JSON_FORMAT)
 
 
 class LoggerService:
     """
     Centralized logging service.
     
-    Provides a singleton-like interface for consistent logging across
-    all application modules.
+    Owns handler setup and the background log listener. A single module-level
+    instance backs setup_logging() and the listener functions.
     
     Usage:
         from logger import logger
@@ -98,23 +210,13 @@ class LoggerService:
         log.info("Module-specific message")
     """
     
-    _instance: Optional["LoggerService"] = None
-    _initialized: bool = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        if LoggerService._initialized:
-            return
-        
-        self._loggers: dict[str, logging.Logger] = {}
         self._log_dir: Optional[Path] = None
         self._debug_mode: bool = False
+        self._listener: Optional[QueueListener] = None
         
-        LoggerService._initialized = True
+        # Make sure buffered file records reach disk on interpreter exit
+        atexit.register(self.stop_listener)
     
     def setup(
         self,
@@ -145,19 +247,44 @@ class LoggerService:
         
         # Remove any existing handlers
         root_logger.handlers.clear()
+        self.stop_listener()
         
-        # Add handlers
-        root_logger.addHandler(self._create_console_handler(debug))
-        root_logger.addHandler(self._create_file_handler("app.log", debug))
-        root_logger.addHandler(self._create_error_file_handler("error.log"))
+        # Create file handlers
+        file_handlers = [
+            self._create_file_handler("app.log", debug),
+            self._create_error_file_handler("error.log"),
+        ]
         
         if enable_json:
-            root_logger.addHandler(self._create_json_handler("app.json.log"))
+            file_handlers.append(self._create_json_handler("app.json.log"))
+        
+        # Loggers only enqueue records for the files; a background listener
+        # thread does the disk I/O off the request path. The queue handler
+        # goes first so it copies each record before console formatting.
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        self.start_listener()
+        
+        # Console stays synchronous so output interleaves with the server's own
+        root_logger.addHandler(self._create_console_handler(debug))
         
         # Log initialization
-        init_logger = self.get_logger("logger.setup")
+        init_logger = get_logger("logger.setup")
         init_logger.info(f"Logging initialized | debug={debug} | log_dir={log_dir}")
     
+    def start_listener(self) -> None:
+        """Start the background thread that writes queued log records."""
+        if self._listener and self._listener._thread is None:
+            self._listener.start()
+    
+    def stop_listener(self) -> None:
+        """Flush queued log records and stop the background thread."""
+        if self._listener and self._listener._thread is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.flush()
+    
     def _create_console_handler(self, debug: bool) -> logging.Handler:
         """Create console handler with colored output."""
         handler = logging.StreamHandler(sys.stdout)
@@ -175,10 +302,10 @@ class LoggerService:
         return handler
     
     def _create_file_handler(self, filename: str, debug: bool) -> logging.Handler:
-        """Create rotating file handler for general logs."""
+        """Create buffered rotating file handler for general logs."""
         log_path = self._log_dir / filename
         
-        handler = RotatingFileHandler(
+        handler = BufferedRotatingFileHandler(
             log_path,
             maxBytes=LogConfig.MAX_BYTES,
             backupCount=LogConfig.BACKUP_COUNT,
@@ -186,8 +313,7 @@ class LoggerService:
         )
         handler.setLevel(LogConfig.DEBUG_LEVEL if debug else LogConfig.DEFAULT_LEVEL)
         
-        formatter = logging.Formatter(LogConfig.FILE_FORMAT, LogConfig.DATE_FORMAT)
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FILE_FORMATTER)
         
         return handler
     
@@ -203,8 +329,7 @@ class LoggerService:
         )
         handler.setLevel(logging.ERROR)
         
-        formatter = logging.Formatter(LogConfig.FILE_FORMAT, LogConfig.DATE_FORMAT)
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FILE_FORMATTER)
         
         return handler
     
@@ -220,26 +345,10 @@ class LoggerService:
         )
         handler.setLevel(LogConfig.DEFAULT_LEVEL)
         
-        formatter = CustomJsonFormatter(LogConfig.JSON_FORMAT)
-        handler.setFormatter(formatter)
+        handler.setFormatter(_JSON_FORMATTER)
         
         return handler
     
-    def get_logger(self, name: str) -> logging.Logger:
-        """
-        Get a named logger instance.
-        
-        Args:
-            name: Logger name (typically module name)
-            
-        Returns:
-            logging.Logger: Configured logger instance
-        """
-        if name not in self._loggers:
-            self._loggers[name] = logging.getLogger(name)
-        
-        return self._loggers[name]
-    
     def set_level(self, level: int, logger_name: Optional[str] = None) -> None:
         """
         Change log level at runtime.
@@ -278,6 +387,26 @@ def setup_logging(
     _logger_service.setup(log_dir, debug, enable_json, app_name)
 
 
+def start_log_listener() -> None:
+    """
+    Start writing queued log records.
+    
+    setup_logging() starts the listener automatically; call this to
+    resume after stop_log_listener() (e.g. on application startup).
+    """
+    _logger_service.start_listener()
+
+
+def stop_log_listener() -> None:
+    """
+    Flush pending log records and stop the writer thread.
+    
+    Call this on application shutdown so no records are lost.
+    """
+    _logger_service.stop_listener()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger for a specific module.
@@ -293,7 +422,7 @@ def get_logger(name: str) -> logging.Logger:
         logger = get_logger(__name__)
         logger.info("Hello from my module")
     """
-    return _logger_service.get_logger(name)
+    return logging.getLogger(name)
 
 
 # Convenience: Default application logger
@@ -5,9 +5,11 @@ Data models for API request/response validation and serialization.
 """
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 # Request Models
@@ -197,3 +199,41 @@ class ErrorResponse(BaseModel):
         default_factory=datetime.utcnow,
         description="Timestamp when the error occurred",
     )
+
+
+# Helpers
+def build_trusted(cls: type[ModelT], **fields) -> ModelT:
+    """
+    Build a model from server-side data without running validation.
+    
+    Only for values the server produced itself (file stats, service
+    results, fixed status strings). Defaults and default factories are
+    still applied. Client input must go through model_validate instead.
+    
+    Args:
+        cls: Model class to build
+        **fields: Field values
+        
+    Returns:
+        ModelT: Model instance
+    """
+    return cls.model_construct(**fields)
+
+
+# Prebuilt adapters for the hot /tailor path; building them once keeps the
+# compiled validator/serializer around instead of resolving it per call.
+TAILOR_REQUEST_ADAPTER: TypeAdapter[TailorRequest] = TypeAdapter(TailorRequest)
+TAILOR_RESPONSE_ADAPTER: TypeAdapter[TailorResponse] = TypeAdapter(TailorResponse)
+
+
+def dump_tailor_response(response: TailorResponse) -> bytes:
+    """
+    Serialize a TailorResponse to JSON bytes with the shared adapter.
+    
+    Args:
+        response: Response model instance
+        
+    Returns:
+        bytes: JSON-encoded response body
+    """
+    return TAILOR_RESPONSE_ADAPTER.dump_json(response)
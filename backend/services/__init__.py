@@ -2,11 +2,34 @@
 Services Module
 
 Contains business logic services for the Resume Tailor application.
+
+Service classes are resolved lazily (PEP 562): a submodule is only
+imported the first time one of its names is accessed, and the result
+is cached in the package namespace.
 """
 
-from .resume_parser import ResumeParser, ParsedResume, ContactInfo
-from .gemini_service import GeminiService, TailoredContent, JobDetails
-from .document_gen import DocumentGenerator, GeneratedDocument
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .resume_parser import ResumeParser, ParsedResume, ContactInfo
+    from .gemini_service import GeminiService, TailoredContent, JobDetails
+    from .document_gen import DocumentGenerator, GeneratedDocument
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    # Resume Parser
+    "ResumeParser": ".resume_parser",
+    "ParsedResume": ".resume_parser",
+    "ContactInfo": ".resume_parser",
+    # Gemini Service
+    "GeminiService": ".gemini_service",
+    "TailoredContent": ".gemini_service",
+    "JobDetails": ".gemini_service",
+    # Document Generator
+    "DocumentGenerator": ".document_gen",
+    "GeneratedDocument": ".document_gen",
+}
 
 __all__ = [
     # Resume Parser
@@ -14,10 +37,25 @@ __all__ = [
     "ParsedResume",
     "ContactInfo",
     # Gemini Service
-    "GeminiService", 
+    "GeminiService",
     "TailoredContent",
     "JobDetails",
     # Document Generator
     "DocumentGenerator",
     "GeneratedDocument",
 ]
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the name."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
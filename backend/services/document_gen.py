@@ -5,19 +5,271 @@ Handles generation of PDF and DOCX documents from tailored resume content.
 Supports professional formatting and multiple output formats.
 """
 
+import heapq
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Literal, Optional
 
 from logger import get_logger
 
+# Document backends (optional; checked when a format is requested)
+try:
+    from fpdf import FPDF
+    _PDF_AVAILABLE = True
+except ImportError:
+    FPDF = object
+    _PDF_AVAILABLE = False
+
+try:
+    from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt, RGBColor
+    _DOCX_AVAILABLE = True
+except ImportError:
+    _DOCX_AVAILABLE = False
+
 # Module logger
 logger = get_logger(__name__)
 
+# Shared pool for rendering the requested formats in parallel
+_FORMAT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="docgen")
+
+# Characters not allowed in generated filenames (deleted via str.translate)
+_FILENAME_INVALID_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Runs of whitespace and/or underscores, collapsed to a single '_'
+_FILENAME_SEPARATOR_RE = re.compile(r'[\s_]+')
+
+# Problematic characters -> ASCII equivalents for the latin-1 PDF fonts
+_PDF_TRANSLATE = str.maketrans({
+    '\u201c': '"',  # Curly double quotes
+    '\u201d': '"',
+    '\u2018': "'",  # Curly single quotes
+    '\u2019': "'",
+    '–': '-',
+    '—': '-',
+    '…': '...',
+    '•': '-',
+    '·': '-',
+    '●': '-',
+    '○': '-',
+    '■': '-',
+    '□': '-',
+    '▪': '-',
+    '▫': '-',
+    '→': '->',
+    '←': '<-',
+    '↑': '^',
+    '↓': 'v',
+    '✓': '[x]',
+    '✗': '[ ]',
+    '★': '*',
+    '☆': '*',
+    '©': '(c)',
+    '®': '(R)',
+    '™': '(TM)',
+    '°': ' degrees',
+    '±': '+/-',
+    '×': 'x',
+    '÷': '/',
+    '≤': '<=',
+    '≥': '>=',
+    '≠': '!=',
+    '∞': 'infinity',
+    '\u200b': '',  # Zero-width space
+    '\u00a0': ' ',  # Non-breaking space
+    '\ufeff': '',  # BOM
+})
+
+# Anything the PDF core fonts cannot encode
+_NON_LATIN1_RE = re.compile(r'[^\x00-\xff]')
+
+# Common section headers
+SECTION_HEADERS = frozenset({
+    'summary', 'objective', 'profile', 'experience', 'work history',
+    'employment', 'education', 'skills', 'technical skills',
+    'competencies', 'certifications', 'projects', 'achievements',
+    'accomplishments', 'awards', 'publications', 'languages',
+    'interests', 'hobbies', 'references', 'volunteer', 'leadership',
+    'professional experience', 'professional summary', 'core competencies',
+    'career objective', 'about me', 'contact', 'contact information',
+})
+
+# A known header on its own, or followed by ':' (case-insensitive)
+_SECTION_HEADER_RE = re.compile(
+    r"(?:%s)(?::|\Z)" % "|".join(map(re.escape, sorted(SECTION_HEADERS))),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=2048)
+def _is_section_header(line: str) -> bool:
+    """Check if a line is a section header (memoized; resume lines repeat across formats)."""
+    line_stripped = line.strip()
+    
+    # Check against common headers
+    if _SECTION_HEADER_RE.match(line_stripped):
+        return True
+    
+    # Check if ALL CAPS (likely a header) with at most 5 words; maxsplit
+    # stops after the 6th word so long lines are never fully split
+    if line_stripped.isupper() and len(line_stripped.split(None, 5)) <= 5:
+        return True
+    
+    return False
+
+
+@lru_cache(maxsize=2048)
+def _is_separator(line: str) -> bool:
+    """Check if a line is a separator (memoized)."""
+    stripped = line.strip()
+    if not stripped:
+        return False
+    
+    # Check for lines of repeated characters
+    if len(set(stripped)) == 1 and stripped[0] in '-=_*':
+        return len(stripped) >= 3
+    
+    return False
+
 
-@dataclass
+def _tokenize(content: str) -> list[tuple[str, str]]:
+    """
+    Classify resume content lines once for all output writers.
+    
+    Token kinds: 'blank', 'sep', 'name' (first content line that is not a
+    header), 'header', 'bullet' (marker removed), 'contact' (contains '|')
+    and 'text'. Text is stripped but otherwise uncleaned.
+    
+    Args:
+        content: Tailored resume content
+        
+    Returns:
+        list[tuple[str, str]]: (kind, text) pairs in document order
+    """
+    tokens = []
+    seen_name = False
+    
+    for line in content.split('\n'):
+        line = line.strip()
+        
+        if not line:
+            tokens.append(('blank', ''))
+        elif _is_separator(line):
+            tokens.append(('sep', ''))
+        elif _is_section_header(line):
+            tokens.append(('header', line))
+        elif not seen_name:
+            # First line is usually the name
+            tokens.append(('name', line))
+            seen_name = True
+        elif line.startswith(('•', '-', '*')):
+            tokens.append(('bullet', line.lstrip('•-* \t')))
+        elif '|' in line:
+            # Contact info or inline data
+            tokens.append(('contact', line))
+        else:
+            tokens.append(('text', line))
+    
+    return tokens
+
+
+def _format_mtime(st: os.stat_result) -> str:
+    """
+    Format a stat mtime like datetime.fromtimestamp(...).isoformat().
+    
+    Works from the integer st_mtime_ns with time.strftime, so listing many
+    files does not build a throwaway datetime per entry.
+    
+    Args:
+        st: Stat result of the file
+        
+    Returns:
+        str: Local-time ISO 8601 timestamp (microseconds only when non-zero)
+    """
+    # Round to the microsecond as datetime does, then split off seconds
+    seconds, micros = divmod((st.st_mtime_ns + 500) // 1000, 1_000_000)
+    stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+    return f"{stamp}.{micros:06d}" if micros else stamp
+
+
+# PDF text style per token kind: (font style, size, RGB text colour)
+_PDF_STYLES = {
+    'name': ('B', 16, (0, 0, 0)),
+    'header': ('B', 11, (44, 62, 80)),
+    'bullet': ('', 10, (0, 0, 0)),
+    'contact': ('', 9, (80, 80, 80)),
+    'text': ('', 10, (0, 0, 0)),
+}
+
+
+@lru_cache(maxsize=1)
+def _docx_template() -> bytes:
+    """
+    Build the base DOCX with the resume paragraph styles, once per process.
+    
+    Formatting lives in named paragraph styles (ResumeName, ResumeHeader,
+    ResumeContact) instead of being set on every run, so each document
+    only loads these bytes and tags paragraphs with a style name.
+    
+    Returns:
+        bytes: Serialized template document
+    """
+    doc = Document()
+    styles = doc.styles
+    
+    # Modify Normal style
+    normal_style = styles['Normal']
+    normal_style.font.name = 'Calibri'
+    normal_style.font.size = Pt(11)
+    
+    def add_style(name, size, color, bold=False, center=False):
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal_style
+        style.font.bold = bold
+        style.font.size = Pt(size)
+        style.font.color.rgb = RGBColor(*color)
+        if center:
+            style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        return style
+    
+    add_style('ResumeName', 18, (0, 0, 0), bold=True, center=True)
+    header = add_style('ResumeHeader', 12, (44, 62, 80), bold=True)
+    header.paragraph_format.space_after = Pt(6)
+    add_style('ResumeContact', 10, (80, 80, 80), center=True)
+    
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class ResumePDF(FPDF):
+    """Custom PDF class for resume formatting."""
+    
+    def __init__(self):
+        super().__init__()
+        self.set_auto_page_break(auto=True, margin=15)
+        self.set_margins(15, 15, 15)  # Left, Top, Right margins
+    
+    def header(self):
+        pass  # No header needed
+    
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Helvetica', 'I', 8)
+        self.set_text_color(128, 128, 128)
+        self.cell(0, 10, f'Page {self.page_no()}', align='C')
+
+
+@dataclass(slots=True, frozen=True)
 class GeneratedDocument:
     """Information about a generated document."""
     
@@ -50,7 +302,7 @@ class DocumentGenerator:
         files = generator.generate(content, ["pdf", "docx"])
     """
     
-    SUPPORTED_FORMATS = {"pdf", "docx"}
+    SUPPORTED_FORMATS = frozenset({"pdf", "docx"})
     
     def __init__(self, output_dir: Path):
         """
@@ -89,43 +341,78 @@ class DocumentGenerator:
             f"Generating documents in formats: {formats}",
         )
         
-        # Validate formats
-        invalid_formats = set(formats) - self.SUPPORTED_FORMATS
-        if invalid_formats:
+        # Validate formats (issuperset walks the list without building a
+        # set; the invalid set is only computed for the error message)
+        if not self.SUPPORTED_FORMATS.issuperset(formats):
+            invalid_formats = set(formats) - self.SUPPORTED_FORMATS
             logger.error(f"Invalid formats requested: {invalid_formats}")
             raise ValueError(f"Unsupported formats: {invalid_formats}")
         
-        generated = []
+        # Same format twice would race on the same filename
+        formats = list(dict.fromkeys(formats))
         
-        for fmt in formats:
-            try:
-                filename = self._generate_filename(fmt, job_title, company)
-                output_path = self.output_dir / filename
-                
-                if fmt == "pdf":
-                    self._generate_pdf(content, output_path, candidate_name)
-                elif fmt == "docx":
-                    self._generate_docx(content, output_path, candidate_name)
-                
-                # Get file size
-                size_bytes = output_path.stat().st_size
-                
-                doc = GeneratedDocument(
-                    path=output_path,
-                    format=fmt,
-                    filename=filename,
-                    size_bytes=size_bytes,
-                    created_at=datetime.now(),
-                )
-                generated.append(doc)
-                
-                logger.info(f"Generated {fmt.upper()}: {filename} ({size_bytes} bytes)")
-                
-            except Exception as e:
-                logger.error(f"Failed to generate {fmt}: {e}")
-                raise RuntimeError(f"Failed to generate {fmt.upper()} document: {e}")
+        # Classify lines once; the token list is shared read-only by all writers
+        tokens = _tokenize(content)
         
-        return generated
+        # PDF and DOCX are independent, so render them concurrently
+        if len(formats) == 1:
+            return [self._generate_one(formats[0], tokens, job_title, company, candidate_name)]
+        
+        futures = [
+            _FORMAT_EXECUTOR.submit(
+                self._generate_one, fmt, tokens, job_title, company, candidate_name
+            )
+            for fmt in formats
+        ]
+        return [future.result() for future in futures]
+    
+    def _generate_one(
+        self,
+        fmt: Literal["pdf", "docx"],
+        tokens: list[tuple[str, str]],
+        job_title: Optional[str],
+        company: Optional[str],
+        candidate_name: Optional[str],
+    ) -> GeneratedDocument:
+        """
+        Generate a single document.
+        
+        Args:
+            fmt: Output format
+            tokens: Classified content lines (see _tokenize)
+            job_title: Job title for filename
+            company: Company name for filename
+            candidate_name: Candidate name for document header
+            
+        Returns:
+            GeneratedDocument: Generated document information
+        """
+        try:
+            filename = self._generate_filename(fmt, job_title, company)
+            output_path = self.output_dir / filename
+            
+            # Writers report the byte count from the file position, so no
+            # extra stat() is needed for the size
+            if fmt == "pdf":
+                size_bytes = self._generate_pdf(tokens, output_path, candidate_name)
+            else:
+                size_bytes = self._generate_docx(tokens, output_path, candidate_name)
+            
+            doc = GeneratedDocument(
+                path=output_path,
+                format=fmt,
+                filename=filename,
+                size_bytes=size_bytes,
+                created_at=datetime.now(),
+            )
+            
+            logger.info(f"Generated {fmt.upper()}: {filename} ({size_bytes} bytes)")
+            
+            return doc
+            
+        except Exception as e:
+            logger.error(f"Failed to generate {fmt}: {e}")
+            raise RuntimeError(f"Failed to generate {fmt.upper()} document: {e}")
     
     def _generate_filename(
         self,
@@ -169,75 +456,50 @@ class DocumentGenerator:
     
     def _sanitize_for_filename(self, text: str) -> str:
         """Sanitize text for use in filename."""
-        # Remove or replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', text)
-        sanitized = re.sub(r'\s+', '_', sanitized)
-        sanitized = re.sub(r'_+', '_', sanitized)
+        # Drop invalid characters, then collapse whitespace/underscore runs
+        sanitized = text.translate(_FILENAME_INVALID_CHARS)
+        sanitized = _FILENAME_SEPARATOR_RE.sub('_', sanitized)
         return sanitized.strip('_')
     
     def _generate_pdf(
         self, 
-        content: str, 
+        tokens: list[tuple[str, str]], 
         output_path: Path,
         candidate_name: Optional[str] = None
-    ) -> None:
+    ) -> int:
         """
         Generate a PDF document using FPDF2.
         
         Args:
-            content: Resume content
+            tokens: Classified content lines (see _tokenize)
             output_path: Output file path
             candidate_name: Optional candidate name for header
+            
+        Returns:
+            int: Size of the written file in bytes
         """
         logger.debug(f"Generating PDF: {output_path}")
         
-        try:
-            from fpdf import FPDF
-        except ImportError:
+        if not _PDF_AVAILABLE:
             logger.error("fpdf2 not installed. Run: pip install fpdf2")
             raise ImportError("fpdf2 is required for PDF generation. Install with: pip install fpdf2")
         
-        class ResumePDF(FPDF):
-            """Custom PDF class for resume formatting."""
-            
-            def __init__(self):
-                super().__init__()
-                self.set_auto_page_break(auto=True, margin=15)
-                self.set_margins(15, 15, 15)  # Left, Top, Right margins
-            
-            def header(self):
-                pass  # No header needed
-            
-            def footer(self):
-                self.set_y(-15)
-                self.set_font('Helvetica', 'I', 8)
-                self.set_text_color(128, 128, 128)
-                self.cell(0, 10, f'Page {self.page_no()}', align='C')
-        
         pdf = ResumePDF()
         pdf.add_page()
         
         # Page width for calculations (A4 = 210mm, minus margins)
         page_width = 210 - 30  # 180mm usable width
         
-        # Parse and format content
-        lines = content.split('\n')
+        # Font/colour currently applied; fpdf2 restores both after the
+        # footer on page breaks, so this stays accurate across pages
+        current_style = None
         
-        # Track if we're at the start (for name)
-        is_first_content = True
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
+        for kind, text in tokens:
+            if kind == 'blank':
                 pdf.ln(3)
                 continue
             
-            # Check if line is a section header (ALL CAPS or common headers)
-            is_header = self._is_section_header(line)
-            
-            # Check for separator lines
-            if self._is_separator(line):
+            if kind == 'sep':
                 pdf.set_draw_color(200, 200, 200)
                 y = pdf.get_y()
                 pdf.line(15, y, 195, y)
@@ -245,240 +507,124 @@ class DocumentGenerator:
                 continue
             
             # Clean the text for PDF
-            clean_text = self._clean_text_for_pdf(line)
+            clean_text = self._clean_text_for_pdf(text)
             
             # Skip empty lines after cleaning
             if not clean_text.strip():
                 continue
             
+            # Only touch font/colour when the style actually changes (runs of
+            # bullets or body text share one)
+            style = _PDF_STYLES[kind]
+            if style != current_style:
+                pdf.set_font('Helvetica', style[0], style[1])
+                pdf.set_text_color(*style[2])
+                current_style = style
+            
             # Format based on line type
-            if is_first_content and not is_header:
-                # First line is usually the name
-                pdf.set_font('Helvetica', 'B', 16)
-                pdf.set_text_color(0, 0, 0)
+            if kind == 'name':
                 pdf.cell(0, 10, clean_text, ln=True, align='C')
-                is_first_content = False
-            elif is_header:
+            elif kind == 'header':
                 # Section header
                 pdf.ln(3)
-                pdf.set_font('Helvetica', 'B', 11)
-                pdf.set_text_color(44, 62, 80)
                 pdf.cell(0, 7, clean_text, ln=True)
                 pdf.set_draw_color(44, 62, 80)
                 y = pdf.get_y()
                 pdf.line(15, y, 195, y)
                 pdf.ln(2)
-            elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
+            elif kind == 'bullet':
                 # Bullet point - use indentation with cell width instead of set_x
-                pdf.set_font('Helvetica', '', 10)
-                pdf.set_text_color(0, 0, 0)
-                clean_line = line.lstrip('•-* \t')
-                clean_line = self._clean_text_for_pdf(clean_line)
-                if clean_line.strip():
-                    # Add bullet indent using cell, then multi_cell for text
-                    pdf.cell(5, 5, "-", ln=False)
-                    pdf.multi_cell(0, 5, clean_line)
-            elif '|' in line and len(line.split('|')) >= 2:
+                # Add bullet indent using cell, then multi_cell for text
+                pdf.cell(5, 5, "-", ln=False)
+                pdf.multi_cell(0, 5, clean_text)
+            elif kind == 'contact':
                 # Contact info or inline data
-                pdf.set_font('Helvetica', '', 9)
-                pdf.set_text_color(80, 80, 80)
                 pdf.cell(0, 6, clean_text, ln=True, align='C')
             else:
                 # Regular text
-                pdf.set_font('Helvetica', '', 10)
-                pdf.set_text_color(0, 0, 0)
-                if clean_text.strip():
-                    pdf.multi_cell(0, 5, clean_text)
+                pdf.multi_cell(0, 5, clean_text)
         
-        pdf.output(output_path)
+        # Hand fpdf2 the open file so the serialized document goes straight
+        # to disk (fpdf2 assembles the byte buffer in one pass either way)
+        with open(output_path, 'wb') as fh:
+            pdf.output(fh)
+            size_bytes = fh.tell()
         logger.debug(f"PDF generated successfully: {output_path}")
+        
+        return size_bytes
     
     def _generate_docx(
         self, 
-        content: str, 
+        tokens: list[tuple[str, str]], 
         output_path: Path,
         candidate_name: Optional[str] = None
-    ) -> None:
+    ) -> int:
         """
         Generate a DOCX document using python-docx.
         
         Args:
-            content: Resume content
+            tokens: Classified content lines (see _tokenize)
             output_path: Output file path
             candidate_name: Optional candidate name for header
+            
+        Returns:
+            int: Size of the written file in bytes
         """
         logger.debug(f"Generating DOCX: {output_path}")
         
-        try:
-            from docx import Document
-            from docx.shared import Inches, Pt, RGBColor
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            from docx.enum.style import WD_STYLE_TYPE
-        except ImportError:
+        if not _DOCX_AVAILABLE:
             logger.error("python-docx not installed. Run: pip install python-docx")
             raise ImportError("python-docx is required for DOCX generation. Install with: pip install python-docx")
         
-        doc = Document()
-        
-        # Set up styles
-        styles = doc.styles
-        
-        # Modify Normal style
-        normal_style = styles['Normal']
-        normal_style.font.name = 'Calibri'
-        normal_style.font.size = Pt(11)
-        
-        # Parse and format content
-        lines = content.split('\n')
-        is_first_content = True
+        doc = Document(BytesIO(_docx_template()))
+        add_paragraph = doc.add_paragraph
         
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                doc.add_paragraph()
-                continue
-            
-            # Check if line is a section header
-            is_header = self._is_section_header(line)
-            
-            # Skip separator lines
-            if self._is_separator(line):
+        for kind, text in tokens:
+            if kind == 'blank':
+                add_paragraph()
+            elif kind == 'sep':
+                # Skip separator lines
                 continue
-            
-            if is_first_content and not is_header:
-                # First line is usually the name
-                p = doc.add_paragraph()
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                run = p.add_run(line)
-                run.bold = True
-                run.font.size = Pt(18)
-                run.font.color.rgb = RGBColor(0, 0, 0)
-                is_first_content = False
-            elif is_header:
+            elif kind == 'name':
+                add_paragraph(text, style='ResumeName')
+            elif kind == 'header':
                 # Section header
-                p = doc.add_paragraph()
-                run = p.add_run(line)
-                run.bold = True
-                run.font.size = Pt(12)
-                run.font.color.rgb = RGBColor(44, 62, 80)
-                # Add bottom border effect (using a line)
-                p.paragraph_format.space_after = Pt(6)
-            elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                # Bullet point
-                clean_line = line.lstrip('•-* ')
-                p = doc.add_paragraph(clean_line, style='List Bullet')
-            elif '|' in line and len(line.split('|')) >= 2:
-                # Contact info
-                p = doc.add_paragraph()
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                run = p.add_run(line)
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(80, 80, 80)
+                add_paragraph(text, style='ResumeHeader')
+            elif kind == 'bullet':
+                add_paragraph(text, style='List Bullet')
+            elif kind == 'contact':
+                add_paragraph(text, style='ResumeContact')
             else:
                 # Regular text
-                doc.add_paragraph(line)
+                add_paragraph(text)
         
-        doc.save(output_path)
+        with open(output_path, 'wb') as fh:
+            doc.save(fh)
+            size_bytes = fh.tell()
         logger.debug(f"DOCX generated successfully: {output_path}")
-    
-    def _is_section_header(self, line: str) -> bool:
-        """Check if a line is a section header."""
-        line_stripped = line.strip()
-        
-        # Common section headers
-        headers = [
-            'summary', 'objective', 'profile', 'experience', 'work history',
-            'employment', 'education', 'skills', 'technical skills',
-            'competencies', 'certifications', 'projects', 'achievements',
-            'accomplishments', 'awards', 'publications', 'languages',
-            'interests', 'hobbies', 'references', 'volunteer', 'leadership',
-            'professional experience', 'professional summary', 'core competencies',
-            'career objective', 'about me', 'contact', 'contact information'
-        ]
-        
-        line_lower = line_stripped.lower()
         
-        # Check against common headers
-        for header in headers:
-            if line_lower == header or line_lower.startswith(header + ':'):
-                return True
-        
-        # Check if ALL CAPS (likely a header)
-        if line_stripped.isupper() and 1 <= len(line_stripped.split()) <= 5:
-            return True
-        
-        return False
-    
-    def _is_separator(self, line: str) -> bool:
-        """Check if a line is a separator."""
-        stripped = line.strip()
-        if not stripped:
-            return False
-        
-        # Check for lines of repeated characters
-        if len(set(stripped)) == 1 and stripped[0] in '-=_*':
-            return len(stripped) >= 3
-        
-        return False
+        return size_bytes
     
     def _clean_text_for_pdf(self, text: str) -> str:
         """Clean text for PDF compatibility."""
-        # Replace problematic characters with ASCII equivalents
-        replacements = {
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '–': '-',
-            '—': '-',
-            '…': '...',
-            '•': '-',
-            '·': '-',
-            '●': '-',
-            '○': '-',
-            '■': '-',
-            '□': '-',
-            '▪': '-',
-            '▫': '-',
-            '→': '->',
-            '←': '<-',
-            '↑': '^',
-            '↓': 'v',
-            '✓': '[x]',
-            '✗': '[ ]',
-            '★': '*',
-            '☆': '*',
-            '©': '(c)',
-            '®': '(R)',
-            '™': '(TM)',
-            '°': ' degrees',
-            '±': '+/-',
-            '×': 'x',
-            '÷': '/',
-            '≤': '<=',
-            '≥': '>=',
-            '≠': '!=',
-            '∞': 'infinity',
-            '\u200b': '',  # Zero-width space
-            '\u00a0': ' ',  # Non-breaking space
-            '\ufeff': '',  # BOM
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Replace problematic characters with ASCII equivalents, then any
+        # remaining non-latin1 characters with a space
+        return _NON_LATIN1_RE.sub(' ', text.translate(_PDF_TRANSLATE))
+    
+    def _scandir_files(self):
+        """
+        Iterate generated files in the output directory.
         
-        # Remove any remaining non-latin1 characters
-        cleaned = []
-        for char in text:
-            try:
-                char.encode('latin-1')
-                cleaned.append(char)
-            except UnicodeEncodeError:
-                # Replace with space or skip
-                cleaned.append(' ')
+        Uses os.scandir so each DirEntry carries its own cached stat
+        result, avoiding a separate stat() call per file.
         
-        return ''.join(cleaned)
+        Yields:
+            os.DirEntry: Entries for generated resume files
+        """
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if entry.name.startswith('resume_tailored_') and entry.is_file():
+                    yield entry
     
     def list_generated_files(self) -> list[dict]:
         """
@@ -487,20 +633,24 @@ class DocumentGenerator:
         Returns:
             list[dict]: List of file information
         """
-        files = []
-        
-        for path in self.output_dir.glob('resume_tailored_*'):
-            if path.is_file():
-                files.append({
-                    "filename": path.name,
-                    "format": path.suffix.lstrip('.'),
-                    "size_bytes": path.stat().st_size,
-                    "created_at": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
-                    "path": str(path),
-                })
+        # Sort on the raw mtime from the cached DirEntry stat (newest first)
+        # and only then build the per-file dicts.
+        entries = sorted(
+            ((entry, entry.stat()) for entry in self._scandir_files()),
+            key=lambda item: item[1].st_mtime,
+            reverse=True,
+        )
         
-        # Sort by creation time (newest first)
-        files.sort(key=lambda x: x['created_at'], reverse=True)
+        files = [
+            {
+                "filename": entry.name,
+                "format": os.path.splitext(entry.name)[1].lstrip('.'),
+                "size_bytes": stat.st_size,
+                "created_at": _format_mtime(stat),
+                "path": entry.path,
+            }
+            for entry, stat in entries
+        ]
         
         return files
     
@@ -514,25 +664,33 @@ class DocumentGenerator:
         Returns:
             int: Number of files deleted
         """
-        files = list(self.output_dir.glob('resume_tailored_*'))
+        keep_count = max(keep_count, 0)
+        files = list(self._scandir_files())
         
         if len(files) <= keep_count:
             return 0
         
-        # Sort by modification time
-        files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # Select the keep_count newest entries with a bounded heap (usually
+        # small next to the listing) and delete everything else
+        survivors = {
+            entry.path
+            for entry in heapq.nlargest(
+                keep_count, files, key=lambda x: x.stat().st_mtime
+            )
+        }
+        victims = [entry for entry in files if entry.path not in survivors]
         
         # Delete old files
         deleted = 0
-        for file in files[keep_count:]:
+        for entry in victims:
             try:
-                file.unlink()
+                os.unlink(entry.path)
                 deleted += 1
-                logger.debug(f"Deleted old file: {file.name}")
+                logger.debug(f"Deleted old file: {entry.name}")
             except Exception as e:
-                logger.warning(f"Failed to delete {file.name}: {e}")
+                logger.warning(f"Failed to delete {entry.name}: {e}")
         
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old files")
         
-        return deleted
\ No newline at end of file
+        return deleted
@@ -5,16 +5,313 @@ Handles communication with Google's Gemini API for resume tailoring.
 Provides prompt construction, API calls, response parsing, and error handling.
 """
 
-import json
+import asyncio
+import hashlib
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+import orjson
 
 from logger import get_logger
 
 # Module logger
 logger = get_logger(__name__)
 
+# Tag sections of a tailoring response (see _scan_sections)
+_RESPONSE_TAGS = frozenset({
+    "TAILORED_RESUME",
+    "SUMMARY",
+    "MATCHED_KEYWORDS",
+    "SUGGESTIONS",
+    "ATS_SCORE",
+})
+
+# Sections that only count when they hold a bare number; the first
+# well-formed one wins, as with the old <ATS_SCORE>\s*(\d+) pattern
+_NUMERIC_TAGS = frozenset({"ATS_SCORE"})
+
+# Longest closing tag name ('/' + tag), bounding the '>' lookahead
+_MAX_TAG_NAME = max(map(len, _RESPONSE_TAGS)) + 1
+
+# Markdown code fence (opening ```json line or closing ```) around JSON
+# extraction responses; stripped from both ends in one sub() call
+_RE_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+# Structured output for job extraction: Gemini returns bare JSON matching
+# JobDetails instead of prose or fenced markdown
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_JOB_DETAILS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "company": {"type": "string"},
+        "location": {"type": "string"},
+        "employment_type": {"type": "string"},
+        "experience_level": {"type": "string"},
+        "required_skills": _STRING_LIST,
+        "preferred_skills": _STRING_LIST,
+        "responsibilities": _STRING_LIST,
+        "requirements": _STRING_LIST,
+        "benefits": _STRING_LIST,
+        "salary_range": {"type": "string"},
+    },
+}
+_EXTRACTION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": _JOB_DETAILS_SCHEMA,
+}
+
+# Fallback for malformed extraction JSON: every "key": "string" pair in
+# one pass, mapped onto the scalar JobDetails fields
+_RE_JSON_FIELD = re.compile(r'"(\w+)"\s*:\s*"([^"]*)"')
+_SCALAR_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "employment_type",
+    "experience_level",
+    "salary_range",
+)
+
+# Leading bullet markers stripped from suggestion lines
+_SUGGESTION_BULLETS = "\u2022\u2023\u25e6\u00b7-*"
+
+# Prompt input compression: horizontal whitespace runs, trailing spaces
+# and runs of blank lines (line structure is kept; the model needs it)
+_RE_HSPACE = re.compile(r"[ \t\f\v\u00a0]+")
+_RE_TRAILING_SPACE = re.compile(r" +(?=\n)")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+
+# Job description boilerplate lines that carry no tailoring signal. Only
+# whole lines in the trailing part of the JD are dropped, where these
+# statements sit; requirements and responsibilities above are left alone.
+_JD_BOILERPLATE = [
+    re.compile(r"(?im)^[^\n]*\bequal (?:employment )?opportunity\b[^\n]*(?:\n|\Z)"),
+    re.compile(r"(?im)^[^\n]*\breasonable accommodations?\b[^\n]*(?:\n|\Z)"),
+]
+# Fraction of the job description (from the end) searched for boilerplate
+_JD_BOILERPLATE_TAIL = 0.33
+
+
+# Fixed tailoring instructions and output format. Sent as the model's system
+# instruction so every request shares the same prefix (which Gemini can
+# reuse server-side); only the resume/JD part varies per call.
+_TAILOR_INSTRUCTIONS = """You are an expert resume writer and career coach. Your task is to tailor the given resume to better match the job description while maintaining authenticity and truthfulness.
+
+IMPORTANT RULES:
+1. DO NOT fabricate or add skills/experiences the candidate doesn't have
+2. Reorder and emphasize existing relevant experiences
+3. Use keywords from the job description naturally where applicable
+4. Improve phrasing to highlight relevant achievements
+5. Keep the same overall structure but optimize content
+6. Make it ATS (Applicant Tracking System) friendly
+7. Quantify achievements where possible based on existing information
+
+Please provide your response in the following format:
+
+<TAILORED_RESUME>
+[The complete tailored resume text here, formatted professionally]
+</TAILORED_RESUME>
+
+<SUMMARY>
+[A brief 2-3 sentence summary of the main changes made]
+</SUMMARY>
+
+<MATCHED_KEYWORDS>
+[Comma-separated list of keywords from the job description that match the candidate's experience]
+</MATCHED_KEYWORDS>
+
+<SUGGESTIONS>
+[Bullet points with 3-5 additional suggestions for the candidate to strengthen their application]
+</SUGGESTIONS>
+
+<ATS_SCORE>
+[A number from 0-100 estimating how well this resume will perform with ATS systems for this specific job]
+</ATS_SCORE>"""
+
+
+def _compress_text(text: str) -> str:
+    """
+    Shrink prompt input without changing its content.
+    
+    Collapses runs of spaces/tabs, drops trailing spaces and limits blank
+    lines to one, which trims tokens while keeping the line layout.
+    
+    Args:
+        text: Resume or job description text
+        
+    Returns:
+        str: Compressed text
+    """
+    text = _RE_HSPACE.sub(" ", text.replace("\r\n", "\n"))
+    text = _RE_TRAILING_SPACE.sub("", text)
+    return _RE_BLANK_LINES.sub("\n\n", text).strip()
+
+
+def _strip_boilerplate(job_description: str) -> str:
+    """Remove equal-opportunity / accommodation lines from the end of a job description."""
+    # Start the tail on a line boundary so no line is only partly searched
+    cut = int(len(job_description) * (1 - _JD_BOILERPLATE_TAIL))
+    cut = job_description.rfind("\n", 0, cut) + 1
+    if not cut:
+        return job_description
+    head, tail = job_description[:cut], job_description[cut:]
+    for pattern in _JD_BOILERPLATE:
+        tail = pattern.sub("", tail)
+    return head + tail
+
+
+def _dedupe_terms(terms: Iterable) -> list[str]:
+    """
+    Strip, drop empties and case-insensitive duplicates, keeping first spellings.
+    
+    Kept terms are interned, since the same keywords and skills recur across
+    requests in a long-running server.
+    
+    Args:
+        terms: Keyword or skill strings (non-strings are skipped)
+        
+    Returns:
+        list[str]: Unique terms in first-seen order
+    """
+    seen = set()
+    unique = []
+    for term in terms:
+        if not isinstance(term, str):
+            continue
+        term = term.strip()
+        key = term.casefold()
+        if term and key not in seen:
+            seen.add(key)
+            unique.append(sys.intern(term))
+    return unique
+
+
+def _scan_sections(text: str) -> dict[str, str]:
+    """
+    Extract the <TAG>...</TAG> sections of a tailoring response in one pass.
+    
+    Walks the '<' characters once with str.find instead of running a regex
+    per section over the whole response. Tags match case-insensitively, and
+    each tag's first opening tag pairs with the next closing tag after it,
+    the same as the non-greedy per-section regexes this replaces. Numeric
+    tags only accept digit-only content and otherwise keep looking.
+    
+    Args:
+        text: Raw response text
+        
+    Returns:
+        dict[str, str]: Tag name -> stripped section content (found tags only)
+    """
+    sections = {}
+    opened = {}  # tag -> offset where its content starts
+    
+    pos = text.find("<")
+    while pos != -1:
+        end = text.find(">", pos + 1, pos + _MAX_TAG_NAME + 2)
+        if end != -1:
+            name = text[pos + 1:end].upper()
+            closing = name.startswith("/")
+            if closing:
+                name = name[1:]
+            
+            if name in _RESPONSE_TAGS and name not in sections:
+                if name in _NUMERIC_TAGS:
+                    if not closing:
+                        opened[name] = end + 1
+                    elif name in opened:
+                        content = text[opened[name]:pos].strip()
+                        if content.isdecimal():
+                            sections[name] = content
+                elif not closing:
+                    opened.setdefault(name, end + 1)
+                elif name in opened:
+                    sections[name] = text[opened[name]:pos].strip()
+        
+        pos = text.find("<", pos + 1)
+    
+    return sections
+
+
+class _SectionStreamParser:
+    """
+    Incremental splitter for a streamed tailoring response.
+    
+    Fed text chunks as they arrive, it returns (tag, text) pieces of the
+    section currently open so callers can show content before generation
+    finishes. A trailing '<' that may start a split tag is held back until
+    the next chunk. Pieces are raw (unstripped); the final TailoredContent
+    is still parsed from the complete text.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._open = None
+    
+    def feed(self, chunk: str) -> list[tuple[str, str]]:
+        """
+        Add a chunk and return the section pieces it completes.
+        
+        Args:
+            chunk: Next piece of response text
+            
+        Returns:
+            list[tuple[str, str]]: (tag, text) pieces in order
+        """
+        self.text += chunk
+        return self._drain(final=False)
+    
+    def close(self) -> list[tuple[str, str]]:
+        """Flush any held-back text at the end of the stream."""
+        return self._drain(final=True)
+    
+    def _drain(self, final: bool) -> list[tuple[str, str]]:
+        text = self.text
+        pieces = []
+        
+        def emit(start: int, stop: int) -> None:
+            if self._open is not None and stop > start:
+                pieces.append((self._open, text[start:stop]))
+        
+        pos = self._pos
+        while True:
+            lt = text.find("<", pos)
+            if lt == -1:
+                emit(pos, len(text))
+                pos = len(text)
+                break
+            
+            emit(pos, lt)
+            end = text.find(">", lt + 1, lt + _MAX_TAG_NAME + 2)
+            if end == -1:
+                if not final and len(text) - lt < _MAX_TAG_NAME + 2:
+                    # Possibly a tag split across chunks; wait for more
+                    pos = lt
+                    break
+                # Not a tag, just a literal '<'
+                emit(lt, lt + 1)
+                pos = lt + 1
+                continue
+            
+            name = text[lt + 1:end].upper()
+            if self._open is None and name in _RESPONSE_TAGS:
+                self._open = name
+            elif name == "/" + (self._open or ""):
+                self._open = None
+            else:
+                emit(lt, end + 1)
+            pos = end + 1
+        
+        self._pos = pos
+        return pieces
+
 
 @dataclass
 class JobDetails:
@@ -70,6 +367,143 @@ class TailoredContent:
         }
 
 
+class _SemanticCache:
+    """
+    Nearest-neighbour cache of tailoring results keyed on prompt embeddings.
+    
+    Prompts are embedded with sentence-transformers and searched in a FAISS
+    inner-product index (embeddings are normalized, so scores are cosine
+    similarities). A hit at or above the threshold returns the stored
+    result without calling Gemini. Both libraries are optional; when they
+    are missing the cache disables itself.
+    """
+    
+    MODEL_NAME = "all-MiniLM-L6-v2"
+    DIMENSIONS = 384
+    MAX_ENTRIES = 1024
+    
+    def __init__(self, threshold: float):
+        """
+        Initialize the cache (the embedding model is loaded on first use).
+        
+        Args:
+            threshold: Minimum cosine similarity that counts as a hit
+        """
+        self.threshold = threshold
+        self.enabled = True
+        self._encoder = None
+        self._index = None
+        self._store: list[TailoredContent] = []
+        self._lock = threading.Lock()
+    
+    def _load(self) -> bool:
+        """Load the embedding model and index, disabling the cache if unavailable."""
+        if self._encoder is not None:
+            return True
+        
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning(
+                "Semantic cache disabled: install faiss-cpu and sentence-transformers to enable it"
+            )
+            self.enabled = False
+            return False
+        
+        self._index = faiss.IndexFlatIP(self.DIMENSIONS)
+        self._encoder = SentenceTransformer(self.MODEL_NAME)
+        logger.info(f"Semantic cache ready (threshold: {self.threshold})")
+        return True
+    
+    def lookup(self, prompt: str):
+        """
+        Find a cached result for a prompt.
+        
+        Args:
+            prompt: Full tailoring prompt
+            
+        Returns:
+            tuple: (cached TailoredContent or None, prompt embedding or None)
+        """
+        with self._lock:
+            if not self.enabled or not self._load():
+                return None, None
+        
+        vector = self._encoder.encode([prompt], normalize_embeddings=True)
+        
+        with self._lock:
+            if not self._store:
+                return None, vector
+            scores, ids = self._index.search(vector, 1)
+            if scores[0][0] >= self.threshold:
+                return self._store[ids[0][0]], vector
+        
+        return None, vector
+    
+    def add(self, vector, result: TailoredContent) -> None:
+        """
+        Store a result under its prompt embedding.
+        
+        Args:
+            vector: Embedding returned by lookup()
+            result: Parsed tailoring result
+        """
+        if vector is None:
+            return
+        
+        with self._lock:
+            # Start over rather than grow without bound
+            if len(self._store) >= self.MAX_ENTRIES:
+                self._index.reset()
+                self._store.clear()
+            self._index.add(vector)
+            self._store.append(result)
+
+
+@lru_cache(maxsize=1)
+def _transient_errors() -> tuple[type[Exception], ...]:
+    """
+    Get the Gemini API errors worth retrying (rate limit, 5xx, timeout).
+    
+    Returns:
+        tuple: Exception classes (empty if google-api-core is unavailable)
+    """
+    try:
+        from google.api_core import exceptions
+    except ImportError:
+        return ()
+    
+    return (
+        exceptions.ResourceExhausted,
+        exceptions.ServiceUnavailable,
+        exceptions.InternalServerError,
+        exceptions.DeadlineExceeded,
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_model(api_key: str, model_name: str, system_instruction: Optional[str] = None):
+    """
+    Get a shared GenerativeModel for a key, model and system instruction.
+    
+    Built once per process, so every GeminiService instance and model tier
+    reuses the same configured model object instead of redoing setup.
+    
+    Args:
+        api_key: Google Gemini API key
+        model_name: Gemini model name
+        system_instruction: Optional system instruction for the model
+        
+    Returns:
+        genai.GenerativeModel: Shared model instance
+    """
+    import google.generativeai as genai
+    
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name, system_instruction=system_instruction)
+
+
 class GeminiService:
     """
     Service for interacting with Google Gemini API.
@@ -83,34 +517,74 @@ class GeminiService:
         result = service.tailor_resume(resume_text, job_description)
     """
     
-    def __init__(self, api_key: str, model: str = "gemini-1.5-flash"):
+    # Exact-match response cache size (entries, LRU eviction)
+    EXACT_CACHE_SIZE = 512
+    
+    # Per-input character cap for the tailoring prompt (~6K tokens)
+    MAX_INPUT_CHARS = 24000
+    
+    # Model routing: prompts up to each length use the matching tier (the
+    # last tier takes everything longer); a result scoring below
+    # ESCALATE_BELOW_ATS is retried once on the next tier up
+    TIER_PROMPT_CHARS = (8000, 24000)
+    ESCALATE_BELOW_ATS = 60
+    
+    # Transient API errors: total attempts and exponential backoff (seconds)
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-1.5-flash",
+        semantic_cache_threshold: Optional[float] = None,
+        max_concurrency: int = 8,
+        model_tiers: Optional[list[str]] = None,
+    ):
         """
         Initialize the Gemini service.
         
         Args:
             api_key: Google Gemini API key (from config.settings.gemini_api_key)
             model: Model name to use (from config.settings.gemini_model)
+            semantic_cache_threshold: Similarity for reusing a cached tailoring
+                (from config.settings.semantic_cache_threshold; None disables)
+            max_concurrency: Maximum in-flight async Gemini calls (QPS guard)
+            model_tiers: Cheaper models to route tailoring through, cheapest
+                first (from config.settings.gemini_model_tiers). `model` is
+                always the top tier. None uses `model` for every call.
         """
         self.api_key = api_key
         self.model = model
         self._client = None
         self._model_instance = None
+        self.model_tiers = [t for t in (model_tiers or []) if t != model] + [model]
+        self._sem_cache = (
+            _SemanticCache(semantic_cache_threshold)
+            if semantic_cache_threshold is not None
+            else None
+        )
+        self._exact_cache: OrderedDict[bytes, object] = OrderedDict()
+        self._exact_lock = threading.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         
         logger.info(f"Initializing GeminiService with model: {model}")
         
+        # The client is created on first use (see _ensure_client), so
+        # constructing the service never pays the SDK import/setup cost
+        self._init_lock = threading.Lock()
+        
         if not api_key:
             logger.warning("Gemini API key not provided - service will not function")
-        else:
-            self._initialize_client()
     
     def _initialize_client(self) -> None:
         """Initialize the Gemini client."""
         try:
             import google.generativeai as genai
             
-            genai.configure(api_key=self.api_key)
             self._client = genai
-            self._model_instance = genai.GenerativeModel(self.model)
+            self._model_instance = _get_model(self.api_key, self.model)
             
             logger.info(f"Gemini client initialized successfully with model: {self.model}")
             
@@ -124,32 +598,147 @@ class GeminiService:
             raise RuntimeError(f"Failed to initialize Gemini client: {e}")
     
     def _ensure_client(self) -> None:
-        """Ensure the client is initialized."""
-        if not self._model_instance:
-            if not self.api_key:
-                raise RuntimeError("Gemini API key not configured")
-            self._initialize_client()
+        """Ensure the client is initialized (thread-safe, at most once)."""
+        if self._model_instance:
+            return
+        
+        if not self.api_key:
+            raise RuntimeError("Gemini API key not configured")
+        
+        with self._init_lock:
+            if not self._model_instance:
+                self._initialize_client()
     
-    def tailor_resume(
+    def _get_tailor_model(self, name: str):
+        """Get the (shared) tailoring model instance for a tier."""
+        return _get_model(self.api_key, name, _TAILOR_INSTRUCTIONS)
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff before retry number attempt + 1."""
+        return min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+    
+    def _call_model(self, model, prompt: str, **kwargs):
+        """
+        Call generate_content, retrying transient API errors with backoff.
+        
+        Rate limiting, 5xx and deadline errors are retried up to
+        RETRY_ATTEMPTS calls in total; other errors propagate immediately.
+        
+        Args:
+            model: GenerativeModel to call
+            prompt: Prompt text
+            **kwargs: Extra generate_content arguments (e.g. generation_config)
+            
+        Returns:
+            GenerateContentResponse: SDK response
+        """
+        transient = _transient_errors()
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return model.generate_content(prompt, **kwargs)
+            except transient as e:
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"Transient Gemini API error, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+    
+    async def _call_model_async(self, model, prompt: str, **kwargs):
+        """
+        Async counterpart of _call_model.
+        
+        The concurrency semaphore is held per attempt, not across backoff.
+        
+        Args:
+            model: GenerativeModel to call
+            prompt: Prompt text
+            **kwargs: Extra generate_content arguments (e.g. generation_config)
+            
+        Returns:
+            GenerateContentResponse: SDK response
+        """
+        transient = _transient_errors()
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                async with self._semaphore:
+                    return await model.generate_content_async(prompt, **kwargs)
+            except transient as e:
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"Transient Gemini API error, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+    
+    def _pick_model(self, prompt: str) -> str:
+        """
+        Pick the cheapest model tier suited to a tailoring prompt.
+        
+        Args:
+            prompt: Per-request tailoring prompt
+            
+        Returns:
+            str: Model name
+        """
+        tier = sum(len(prompt) > limit for limit in self.TIER_PROMPT_CHARS)
+        return self.model_tiers[min(tier, len(self.model_tiers) - 1)]
+    
+    def _next_tier(self, model_name: str, result: TailoredContent) -> Optional[str]:
+        """
+        Get the model to retry a weak result on, if any.
+        
+        Args:
+            model_name: Model that produced the result
+            result: Parsed tailoring result
+            
+        Returns:
+            Optional[str]: Next tier up, or None to keep the result
+        """
+        index = self.model_tiers.index(model_name)
+        if index == len(self.model_tiers) - 1:
+            return None
+        if result.ats_score is not None and result.ats_score >= self.ESCALATE_BELOW_ATS:
+            return None
+        
+        next_model = self.model_tiers[index + 1]
+        logger.info(f"ATS score {result.ats_score} from {model_name}; retrying with {next_model}")
+        return next_model
+    
+    @staticmethod
+    def _prompt_key(prompt: str) -> bytes:
+        """Hash a prompt into an exact-match cache key."""
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    
+    def _exact_get(self, key: bytes):
+        """Get a cached response for a prompt key (None on miss)."""
+        with self._exact_lock:
+            value = self._exact_cache.get(key)
+            if value is not None:
+                self._exact_cache.move_to_end(key)
+            return value
+    
+    def _exact_put(self, key: bytes, value) -> None:
+        """Cache a response for a prompt key, evicting the oldest entry when full."""
+        with self._exact_lock:
+            self._exact_cache[key] = value
+            self._exact_cache.move_to_end(key)
+            if len(self._exact_cache) > self.EXACT_CACHE_SIZE:
+                self._exact_cache.popitem(last=False)
+    
+    def _prepare_tailor(
         self,
         resume_text: str,
         job_description: str,
-        job_title: Optional[str] = None,
-        company: Optional[str] = None,
-        emphasis_keywords: Optional[list[str]] = None,
-    ) -> TailoredContent:
+        job_title: Optional[str],
+        company: Optional[str],
+        emphasis_keywords: Optional[list[str]],
+    ) -> tuple[str, bytes, object, Optional[TailoredContent]]:
         """
-        Tailor the resume content based on job description.
+        Build the tailoring prompt and consult the response caches.
+        
+        Shared by tailor_resume and tailor_resume_async.
         
-        Args:
-            resume_text: Original resume content
-            job_description: Target job description
-            job_title: Optional job title for context
-            company: Optional company name for context
-            emphasis_keywords: Additional keywords to emphasize
-            
         Returns:
-            TailoredContent: AI-tailored resume content
+            tuple: (prompt, exact cache key, semantic embedding, cached result or None)
         """
         self._ensure_client()
         
@@ -167,35 +756,207 @@ class GeminiService:
             emphasis_keywords=emphasis_keywords,
         )
         
+        # Identical prompt seen before: reuse its result outright
+        cache_key = self._prompt_key(prompt)
+        cached = self._exact_get(cache_key)
+        if cached is not None:
+            logger.info("Exact cache hit; skipping Gemini API call")
+            return prompt, cache_key, None, cached
+        
+        # Reuse the result of a near-identical earlier request if enabled
+        sem_vector = None
+        if self._sem_cache is not None:
+            cached, sem_vector = self._sem_cache.lookup(prompt)
+            if cached is not None:
+                logger.info("Semantic cache hit; skipping Gemini API call")
+                return prompt, cache_key, sem_vector, cached
+        
+        return prompt, cache_key, sem_vector, None
+    
+    def _finish_tailor(self, result: TailoredContent, cache_key: bytes, sem_vector) -> TailoredContent:
+        """
+        Populate the response caches with a parsed tailoring result.
+        
+        Shared by tailor_resume and its async/streaming variants.
+        
+        Returns:
+            TailoredContent: The same result
+        """
+        # A missing ATS score usually means the response didn't follow
+        # the expected format, so don't pin it in the caches
+        if result.ats_score is not None:
+            self._exact_put(cache_key, result)
+            if self._sem_cache is not None:
+                self._sem_cache.add(sem_vector, result)
+        
+        logger.info(
+            f"Resume tailored successfully. "
+            f"Matched {len(result.matched_keywords)} keywords, "
+            f"ATS score: {result.ats_score}"
+        )
+        
+        return result
+    
+    def tailor_resume(
+        self,
+        resume_text: str,
+        job_description: str,
+        job_title: Optional[str] = None,
+        company: Optional[str] = None,
+        emphasis_keywords: Optional[list[str]] = None,
+    ) -> TailoredContent:
+        """
+        Tailor the resume content based on job description.
+        
+        Args:
+            resume_text: Original resume content
+            job_description: Target job description
+            job_title: Optional job title for context
+            company: Optional company name for context
+            emphasis_keywords: Additional keywords to emphasize
+            
+        Returns:
+            TailoredContent: AI-tailored resume content
+        """
+        prompt, cache_key, sem_vector, cached = self._prepare_tailor(
+            resume_text, job_description, job_title, company, emphasis_keywords
+        )
+        if cached is not None:
+            return cached
+        
         try:
-            # Call Gemini API
-            logger.debug("Sending request to Gemini API...")
-            response = self._model_instance.generate_content(prompt)
+            # Call Gemini API on the cheapest suitable tier
+            model_name = self._pick_model(prompt)
+            logger.debug(f"Sending request to Gemini API ({model_name})...")
+            response = self._call_model(self._get_tailor_model(model_name), prompt)
             
             # Parse response
             result = self._parse_tailor_response(response.text)
             
-            logger.info(
-                f"Resume tailored successfully. "
-                f"Matched {len(result.matched_keywords)} keywords, "
-                f"ATS score: {result.ats_score}"
-            )
+            next_model = self._next_tier(model_name, result)
+            if next_model:
+                response = self._call_model(self._get_tailor_model(next_model), prompt)
+                result = self._parse_tailor_response(response.text)
             
-            return result
+            return self._finish_tailor(result, cache_key, sem_vector)
             
         except Exception as e:
             logger.error(f"Gemini API error during tailoring: {e}")
             raise RuntimeError(f"Failed to tailor resume: {e}")
     
-    def extract_job_details(self, job_description: str) -> JobDetails:
+    async def tailor_resume_async(
+        self,
+        resume_text: str,
+        job_description: str,
+        job_title: Optional[str] = None,
+        company: Optional[str] = None,
+        emphasis_keywords: Optional[list[str]] = None,
+    ) -> TailoredContent:
         """
-        Extract structured information from job description.
+        Tailor the resume without blocking the event loop.
+        
+        Same as tailor_resume, but awaits the SDK's non-blocking HTTP call,
+        so many tailorings can run concurrently (bounded by max_concurrency).
         
         Args:
-            job_description: Raw job description text
+            resume_text: Original resume content
+            job_description: Target job description
+            job_title: Optional job title for context
+            company: Optional company name for context
+            emphasis_keywords: Additional keywords to emphasize
             
         Returns:
-            JobDetails: Extracted job details
+            TailoredContent: AI-tailored resume content
+        """
+        # Embedding for the semantic cache is CPU-bound; keep it off the loop
+        prepare_args = (resume_text, job_description, job_title, company, emphasis_keywords)
+        if self._sem_cache is not None:
+            prepared = await asyncio.to_thread(self._prepare_tailor, *prepare_args)
+        else:
+            prepared = self._prepare_tailor(*prepare_args)
+        
+        prompt, cache_key, sem_vector, cached = prepared
+        if cached is not None:
+            return cached
+        
+        try:
+            model_name = self._pick_model(prompt)
+            logger.debug(f"Sending async request to Gemini API ({model_name})...")
+            response = await self._call_model_async(self._get_tailor_model(model_name), prompt)
+            
+            result = self._parse_tailor_response(response.text)
+            
+            next_model = self._next_tier(model_name, result)
+            if next_model:
+                response = await self._call_model_async(self._get_tailor_model(next_model), prompt)
+                result = self._parse_tailor_response(response.text)
+            
+            return self._finish_tailor(result, cache_key, sem_vector)
+            
+        except Exception as e:
+            logger.error(f"Gemini API error during tailoring: {e}")
+            raise RuntimeError(f"Failed to tailor resume: {e}")
+    
+    def tailor_resume_stream(
+        self,
+        resume_text: str,
+        job_description: str,
+        job_title: Optional[str] = None,
+        company: Optional[str] = None,
+        emphasis_keywords: Optional[list[str]] = None,
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Tailor the resume, yielding section text as Gemini generates it.
+        
+        Yields (tag, text) pieces (e.g. ("TAILORED_RESUME", "...")) while
+        the response streams in, then ("complete", TailoredContent) parsed
+        from the full response. A cache hit yields only the final tuple.
+        
+        Args:
+            resume_text: Original resume content
+            job_description: Target job description
+            job_title: Optional job title for context
+            company: Optional company name for context
+            emphasis_keywords: Additional keywords to emphasize
+            
+        Yields:
+            tuple[str, object]: Section pieces, then ("complete", TailoredContent)
+        """
+        prompt, cache_key, sem_vector, cached = self._prepare_tailor(
+            resume_text, job_description, job_title, company, emphasis_keywords
+        )
+        if cached is not None:
+            yield "complete", cached
+            return
+        
+        parser = _SectionStreamParser()
+        
+        try:
+            # Already-streamed text can't be retried, so no tier escalation;
+            # the initial request (which fetches the first chunk) still is
+            model_name = self._pick_model(prompt)
+            logger.debug(f"Sending streaming request to Gemini API ({model_name})...")
+            response = self._call_model(self._get_tailor_model(model_name), prompt, stream=True)
+            for chunk in response:
+                yield from parser.feed(chunk.text)
+            yield from parser.close()
+            
+            result = self._finish_tailor(
+                self._parse_tailor_response(parser.text), cache_key, sem_vector
+            )
+            
+        except Exception as e:
+            logger.error(f"Gemini API error during tailoring: {e}")
+            raise RuntimeError(f"Failed to tailor resume: {e}")
+        
+        yield "complete", result
+    
+    def _prepare_extraction(self, job_description: str) -> tuple[str, bytes, Optional[JobDetails]]:
+        """
+        Build the extraction prompt and check the exact-match cache.
+        
+        Returns:
+            tuple: (prompt, cache key, cached result or None)
         """
         self._ensure_client()
         
@@ -204,21 +965,92 @@ class GeminiService:
         
         prompt = self._build_extraction_prompt(job_description)
         
-        try:
-            response = self._model_instance.generate_content(prompt)
-            result = self._parse_extraction_response(response.text)
+        cache_key = self._prompt_key(prompt)
+        cached = self._exact_get(cache_key)
+        if cached is not None:
+            logger.info("Exact cache hit; skipping Gemini API call")
+        
+        return prompt, cache_key, cached
+    
+    def _finish_extraction(self, response_text: str, cache_key: bytes) -> JobDetails:
+        """
+        Parse an extraction response and cache it if anything was found.
+        
+        Returns:
+            JobDetails: Extracted job details
+        """
+        result = self._parse_extraction_response(response_text)
+        
+        # Empty details mean nothing could be parsed; retry next time
+        if result != JobDetails():
+            self._exact_put(cache_key, result)
+        
+        logger.info(
+            f"Job details extracted: {result.title or 'Unknown'} at {result.company or 'Unknown'}"
+        )
+        
+        return result
+    
+    def extract_job_details(self, job_description: str) -> JobDetails:
+        """
+        Extract structured information from job description.
+        
+        Args:
+            job_description: Raw job description text
             
-            logger.info(
-                f"Job details extracted: {result.title or 'Unknown'} at {result.company or 'Unknown'}"
+        Returns:
+            JobDetails: Extracted job details
+        """
+        prompt, cache_key, cached = self._prepare_extraction(job_description)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._call_model(
+                self._model_instance, prompt, generation_config=_EXTRACTION_CONFIG
             )
+            return self._finish_extraction(response.text, cache_key)
             
-            return result
+        except Exception as e:
+            logger.error(f"Failed to extract job details: {e}")
+            # Return empty JobDetails rather than failing
+            return JobDetails()
+    
+    async def extract_job_details_async(self, job_description: str) -> JobDetails:
+        """
+        Extract job details without blocking the event loop.
+        
+        Args:
+            job_description: Raw job description text
+            
+        Returns:
+            JobDetails: Extracted job details
+        """
+        prompt, cache_key, cached = self._prepare_extraction(job_description)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self._call_model_async(
+                self._model_instance, prompt, generation_config=_EXTRACTION_CONFIG
+            )
+            return self._finish_extraction(response.text, cache_key)
             
         except Exception as e:
             logger.error(f"Failed to extract job details: {e}")
             # Return empty JobDetails rather than failing
             return JobDetails()
     
+    def _cap_input(self, text: str, label: str) -> str:
+        """Truncate a prompt input to MAX_INPUT_CHARS, logging when it happens."""
+        if len(text) <= self.MAX_INPUT_CHARS:
+            return text
+        
+        logger.warning(
+            f"{label} truncated from {len(text)} to {self.MAX_INPUT_CHARS} chars for the prompt"
+        )
+        return text[:self.MAX_INPUT_CHARS]
+    
     def _build_tailor_prompt(
         self,
         resume_text: str,
@@ -228,7 +1060,10 @@ class GeminiService:
         emphasis_keywords: Optional[list[str]],
     ) -> str:
         """
-        Build the prompt for resume tailoring.
+        Build the per-request part of the resume tailoring prompt.
+        
+        The instructions and output format are sent separately as the
+        tailoring model's system instruction (_TAILOR_INSTRUCTIONS).
         
         Args:
             resume_text: Original resume content
@@ -240,66 +1075,36 @@ class GeminiService:
         Returns:
             str: Formatted prompt for Gemini
         """
-        keywords_section = ""
-        if emphasis_keywords:
-            keywords_section = f"\n\nAdditional keywords to emphasize: {', '.join(emphasis_keywords)}"
+        # Trim input tokens: whitespace, JD boilerplate, then a hard cap
+        resume_text = self._cap_input(_compress_text(resume_text), "Resume")
+        job_description = self._cap_input(
+            _compress_text(_strip_boilerplate(job_description)), "Job description"
+        )
+        
+        # Assemble in one join so the (large) resume and JD texts are copied
+        # once; the fixed rules and output format live in _TAILOR_INSTRUCTIONS
+        parts = []
         
-        context_section = ""
         if job_title or company:
-            parts = []
+            parts.append("Target Position Information:\n")
             if job_title:
-                parts.append(f"Position: {job_title}")
+                parts.append(f"Position: {job_title}\n")
             if company:
-                parts.append(f"Company: {company}")
-            context_section = f"\n\nTarget Position Information:\n{chr(10).join(parts)}"
+                parts.append(f"Company: {company}\n")
+            parts.append("\n")
         
-        prompt = f"""You are an expert resume writer and career coach. Your task is to tailor the given resume to better match the job description while maintaining authenticity and truthfulness.
-
-IMPORTANT RULES:
-1. DO NOT fabricate or add skills/experiences the candidate doesn't have
-2. Reorder and emphasize existing relevant experiences
-3. Use keywords from the job description naturally where applicable
-4. Improve phrasing to highlight relevant achievements
-5. Keep the same overall structure but optimize content
-6. Make it ATS (Applicant Tracking System) friendly
-7. Quantify achievements where possible based on existing information
-
-{context_section}
-{keywords_section}
-
-===== ORIGINAL RESUME =====
-{resume_text}
-===== END RESUME =====
-
-===== JOB DESCRIPTION =====
-{job_description}
-===== END JOB DESCRIPTION =====
-
-Please provide your response in the following format:
-
-<TAILORED_RESUME>
-[The complete tailored resume text here, formatted professionally]
-</TAILORED_RESUME>
-
-<SUMMARY>
-[A brief 2-3 sentence summary of the main changes made]
-</SUMMARY>
-
-<MATCHED_KEYWORDS>
-[Comma-separated list of keywords from the job description that match the candidate's experience]
-</MATCHED_KEYWORDS>
-
-<SUGGESTIONS>
-[Bullet points with 3-5 additional suggestions for the candidate to strengthen their application]
-</SUGGESTIONS>
-
-<ATS_SCORE>
-[A number from 0-100 estimating how well this resume will perform with ATS systems for this specific job]
-</ATS_SCORE>
-
-Now tailor the resume:"""
+        if emphasis_keywords:
+            parts.append(f"Additional keywords to emphasize: {', '.join(emphasis_keywords)}\n\n")
         
-        return prompt
+        parts += [
+            "===== ORIGINAL RESUME =====\n",
+            resume_text,
+            "\n===== END RESUME =====\n\n===== JOB DESCRIPTION =====\n",
+            job_description,
+            "\n===== END JOB DESCRIPTION =====\n\nNow tailor the resume:",
+        ]
+        
+        return "".join(parts)
     
     def _build_extraction_prompt(self, job_description: str) -> str:
         """
@@ -350,69 +1155,45 @@ JSON Response:"""
         """
         logger.debug("Parsing tailor response")
         
-        # Extract sections using regex
-        tailored_resume = ""
+        # Extract all tag sections in a single pass
+        sections = _scan_sections(response_text)
+        
         summary = None
         matched_keywords = []
         suggestions = []
         ats_score = None
         
         # Extract tailored resume
-        resume_match = re.search(
-            r"<TAILORED_RESUME>\s*(.*?)\s*</TAILORED_RESUME>",
-            response_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        if resume_match:
-            tailored_resume = resume_match.group(1).strip()
-        else:
+        tailored_resume = sections.get("TAILORED_RESUME")
+        if tailored_resume is None:
             # If no tags, try to extract the main content
             logger.warning("Could not find TAILORED_RESUME tags, using full response")
             tailored_resume = response_text
         
         # Extract summary
-        summary_match = re.search(
-            r"<SUMMARY>\s*(.*?)\s*</SUMMARY>",
-            response_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        if summary_match:
-            summary = summary_match.group(1).strip()
+        if "SUMMARY" in sections:
+            summary = sections["SUMMARY"]
         
         # Extract matched keywords
-        keywords_match = re.search(
-            r"<MATCHED_KEYWORDS>\s*(.*?)\s*</MATCHED_KEYWORDS>",
-            response_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        if keywords_match:
-            keywords_text = keywords_match.group(1).strip()
-            matched_keywords = [k.strip() for k in keywords_text.split(",") if k.strip()]
+        keywords_text = sections.get("MATCHED_KEYWORDS")
+        if keywords_text is not None:
+            matched_keywords = _dedupe_terms(keywords_text.split(","))
         
         # Extract suggestions
-        suggestions_match = re.search(
-            r"<SUGGESTIONS>\s*(.*?)\s*</SUGGESTIONS>",
-            response_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        if suggestions_match:
-            suggestions_text = suggestions_match.group(1).strip()
+        suggestions_text = sections.get("SUGGESTIONS")
+        if suggestions_text is not None:
             # Parse bullet points
             suggestions = [
-                line.strip().lstrip("•-*").strip()
-                for line in suggestions_text.split("\n")
-                if line.strip() and not line.strip().startswith("#")
+                stripped.lstrip(_SUGGESTION_BULLETS).strip()
+                for line in suggestions_text.splitlines()
+                if (stripped := line.strip()) and not stripped.startswith("#")
             ]
         
         # Extract ATS score
-        ats_match = re.search(
-            r"<ATS_SCORE>\s*(\d+)\s*</ATS_SCORE>",
-            response_text,
-            re.IGNORECASE
-        )
-        if ats_match:
+        ats_text = sections.get("ATS_SCORE")
+        if ats_text is not None:
             try:
-                ats_score = int(ats_match.group(1))
+                ats_score = int(ats_text)
                 ats_score = max(0, min(100, ats_score))  # Clamp to 0-100
             except ValueError:
                 pass
@@ -440,13 +1221,10 @@ JSON Response:"""
         # Try to extract JSON from the response
         try:
             # Clean up the response - remove markdown code blocks if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```"):
-                cleaned = re.sub(r"```json?\s*", "", cleaned)
-                cleaned = re.sub(r"```\s*$", "", cleaned)
+            cleaned = _RE_JSON_FENCE.sub("", response_text.strip())
             
             # Parse JSON
-            data = json.loads(cleaned)
+            data = orjson.loads(cleaned)
             
             return JobDetails(
                 title=data.get("title"),
@@ -454,25 +1232,25 @@ JSON Response:"""
                 location=data.get("location"),
                 employment_type=data.get("employment_type"),
                 experience_level=data.get("experience_level"),
-                required_skills=data.get("required_skills", []),
-                preferred_skills=data.get("preferred_skills", []),
+                required_skills=_dedupe_terms(data.get("required_skills") or []),
+                preferred_skills=_dedupe_terms(data.get("preferred_skills") or []),
                 responsibilities=data.get("responsibilities", []),
                 requirements=data.get("requirements", []),
                 benefits=data.get("benefits", []),
                 salary_range=data.get("salary_range"),
             )
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             
-            # Try to extract basic info using regex
-            title_match = re.search(r'"title"\s*:\s*"([^"]+)"', response_text)
-            company_match = re.search(r'"company"\s*:\s*"([^"]+)"', response_text)
+            # Try to extract the scalar fields in a single regex pass
+            # (first non-empty value per key wins)
+            fields = {}
+            for match in _RE_JSON_FIELD.finditer(response_text):
+                if match.group(2):
+                    fields.setdefault(match.group(1), match.group(2))
             
-            return JobDetails(
-                title=title_match.group(1) if title_match else None,
-                company=company_match.group(1) if company_match else None,
-            )
+            return JobDetails(**{key: fields.get(key) for key in _SCALAR_FIELDS})
     
     def test_connection(self) -> bool:
         """
@@ -7,18 +7,132 @@ Extracts text content and attempts to identify resume sections.
 IMPORTANT: Resume path must be passed in, obtained from config.settings.resume_path
 """
 
+import logging
+import mmap
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
 from logger import get_logger
 
+try:
+    import pymupdf as fitz  # PyMuPDF
+    _PDF_AVAILABLE = True
+except ImportError:
+    _PDF_AVAILABLE = False
+
+try:
+    from docx import Document
+    _DOCX_AVAILABLE = True
+except ImportError:
+    _DOCX_AVAILABLE = False
+
 # Module logger
 logger = get_logger(__name__)
 
 
-@dataclass
+# Common technical skills to look for, as (display name, pattern) pairs
+_SKILL_GROUPS = [
+    # Programming languages
+    ("Python", r"python"), ("Javascript", r"javascript"), ("Typescript", r"typescript"),
+    ("JAVA", r"java\b"), ("C++", r"c\+\+"), ("C#", r"c#"), ("RUBY", r"ruby"), ("GO", r"go\b"),
+    ("RUST", r"rust"), ("PHP", r"php"), ("Swift", r"swift"), ("Kotlin", r"kotlin"),
+    ("Scala", r"scala"), ("R", r"r\b"), ("Matlab", r"matlab"), ("PERL", r"perl"),
+    # Web technologies
+    ("Html5", r"html5?"), ("CSS3", r"css3?"), ("React", r"react(?:\.?js)?"), ("Angular", r"angular"),
+    ("Vue", r"vue(?:\.?js)?"), ("Node.Js", r"node\.?js"), ("Express", r"express"),
+    ("Django", r"django"), ("Flask", r"flask"), ("Fastapi", r"fastapi"), ("Spring", r"spring\b"),
+    ("Asp.Net", r"asp\.?net"), ("Next.Js", r"next\.?js"), ("NUXT", r"nuxt"),
+    # Databases
+    ("SQL", r"sql\b"), ("Mysql", r"mysql"), ("Postgresql", r"postgresql"), ("Postgres", r"postgres"),
+    ("Mongodb", r"mongodb"), ("Redis", r"redis"), ("Elasticsearch", r"elasticsearch"),
+    ("Dynamodb", r"dynamodb"), ("Cassandra", r"cassandra"), ("Oracle", r"oracle"),
+    ("Sqlite", r"sqlite"), ("Mariadb", r"mariadb"),
+    # Cloud & DevOps
+    ("AWS", r"aws"), ("Amazon Web Services", r"amazon web services"), ("Azure", r"azure"),
+    ("GCP", r"gcp"), ("Google Cloud", r"google cloud"),
+    ("Docker", r"docker"), ("Kubernetes", r"kubernetes"), ("K8S", r"k8s"), ("Terraform", r"terraform"),
+    ("Ansible", r"ansible"), ("Jenkins", r"jenkins"),
+    ("Ci/Cd", r"ci/?cd"), ("Github Actions", r"github actions"), ("Gitlab", r"gitlab"),
+    ("Circleci", r"circleci"),
+    # Data & ML
+    ("Machine Learning", r"machine learning"), ("Deep Learning", r"deep learning"),
+    ("Tensorflow", r"tensorflow"), ("Pytorch", r"pytorch"), ("Keras", r"keras"),
+    ("Pandas", r"pandas"), ("Numpy", r"numpy"), ("Scikit-Learn", r"scikit-learn"),
+    ("Sklearn", r"sklearn"), ("NLP", r"nlp"), ("Computer Vision", r"computer vision"),
+    ("Data Science", r"data science"), ("Data Analytics", r"data analytics"), ("Big Data", r"big data"),
+    ("Spark", r"spark"), ("Hadoop", r"hadoop"),
+    # Tools & Others
+    ("GIT", r"git\b"), ("Linux", r"linux"), ("UNIX", r"unix"), ("BASH", r"bash"), ("Shell", r"shell"),
+    ("Agile", r"agile"), ("Scrum", r"scrum"), ("JIRA", r"jira"),
+    ("Rest Api", r"rest\s?api"), ("Graphql", r"graphql"), ("Microservices", r"microservices"),
+    ("Api Design", r"api design"), ("System Design", r"system design"),
+    ("Oauth", r"oauth"), ("JWT", r"jwt"), ("Websocket", r"websocket"),
+]
+
+# Group name -> display name for every skill pattern
+_SKILL_NAMES = {f"s{i}": name for i, (name, _) in enumerate(_SKILL_GROUPS)}
+
+# All skills in one pass. The alternation sits in a lookahead so nothing is
+# consumed and overlapping mentions ("rest api design") still report both.
+# Patterns are lowercase and matched case-sensitively against lowered text.
+_SKILL_RE = re.compile(
+    r"(?=\b(?:"
+    + "|".join(f"(?P<s{i}>{pattern})" for i, (_, pattern) in enumerate(_SKILL_GROUPS))
+    + r")\b)"
+)
+
+# Character-level fixes applied before whitespace cleanup: NULs and zero-width
+# spaces dropped, typographic quotes/dashes and NBSP normalized, form feeds
+# (page breaks) turned into line breaks
+_CLEAN_TABLE = str.maketrans({
+    "\x00": None,
+    "\u200b": None,
+    "\u00a0": " ",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\f": "\n",
+})
+
+# Runs of three or more newlines, collapsed to one blank line
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Contact details
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# (123) 456-7890, 123-456-7890, 123.456.7890; a "+1" prefix is not captured
+_PHONE_RE = re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+_LINKEDIN_RE = re.compile(r"linkedin\.com/in/[\w-]+", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"github\.com/[\w-]+", re.IGNORECASE)
+_LETTER_RE = re.compile(r"[a-zA-Z]")
+_LEADING_DIGIT_RE = re.compile(r"\d")
+
+
+def _search_from_head(pattern: re.Pattern, text: str, head_end: int) -> Optional[re.Match]:
+    """
+    Search text[:head_end] first, then the remainder only if that misses.
+    
+    Callers cut head_end at a line break, so the result equals a full-text
+    search unless a phone number is split across exactly that line break.
+    
+    Args:
+        pattern: Compiled contact pattern
+        text: Resume text
+        head_end: End offset of the leading region
+        
+    Returns:
+        Optional[re.Match]: First match, or None
+    """
+    return pattern.search(text, 0, head_end) or pattern.search(text, head_end)
+
+
+@dataclass(slots=True)
 class ContactInfo:
     """Extracted contact information from resume."""
     
@@ -41,7 +155,7 @@ class ContactInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResume:
     """Structured representation of a parsed resume."""
     
@@ -52,6 +166,12 @@ class ParsedResume:
     contact_info: Optional[ContactInfo] = None
     skills: list[str] = field(default_factory=list)
     word_count: int = 0
+    needs_ocr: bool = False
+    section_names: tuple[str, ...] = field(init=False, default=())
+    
+    def __post_init__(self) -> None:
+        """Record section names once, for repeated to_dict() calls."""
+        self.section_names = tuple(self.sections)
     
     def get_section(self, section_name: str) -> Optional[str]:
         """Get a specific section by name (case-insensitive)."""
@@ -67,9 +187,10 @@ class ParsedResume:
             "filename": self.filename,
             "format": self.format,
             "word_count": self.word_count,
-            "sections": list(self.sections.keys()),
+            "sections": self.section_names,
             "skills": self.skills,
             "contact_info": self.contact_info.to_dict() if self.contact_info else None,
+            "needs_ocr": self.needs_ocr,
         }
 
 
@@ -87,6 +208,15 @@ class ResumeParser:
     
     SUPPORTED_FORMATS = {".pdf", ".docx", ".doc"}
     
+    # PDFs at least this large are memory-mapped instead of opened by path
+    MMAP_MIN_BYTES = 1024 * 1024
+    
+    # Leading characters searched for contact details before the full text
+    CONTACT_HEAD_CHARS = 1500
+    
+    # Less extracted text than this means a scanned, image-only document
+    MIN_TEXT_CHARS = 50
+    
     # Common section headers in resumes
     SECTION_PATTERNS = [
         r"(?i)^(professional\s+)?summary",
@@ -116,6 +246,12 @@ class ResumeParser:
         r"(?i)^courses?",
     ]
     
+    # All section patterns folded into one alternation, compiled at import time.
+    # Headers are matched as line prefixes, same as the individual patterns.
+    _SECTION_RE = re.compile(
+        "(?i)^(?:" + "|".join(p.removeprefix("(?i)^") for p in SECTION_PATTERNS) + ")"
+    )
+    
     def __init__(self, resume_path: Path):
         """
         Initialize the parser with a resume file path.
@@ -148,6 +284,26 @@ class ResumeParser:
         """
         Parse the resume file and extract content.
         
+        Results are cached per (path, mtime, size), so an unchanged file is
+        only parsed once. Each call gets its own copy of the cached result,
+        so callers may modify it without affecting later requests.
+        
+        Returns:
+            ParsedResume: Structured resume data
+        """
+        st = self.resume_path.stat()
+        cached = _parse_cached(str(self.resume_path), st.st_mtime_ns, st.st_size)
+        return replace(
+            cached,
+            sections=dict(cached.sections),
+            skills=list(cached.skills),
+            contact_info=replace(cached.contact_info) if cached.contact_info else None,
+        )
+    
+    def _parse_file(self) -> ParsedResume:
+        """
+        Read the resume file and extract content, bypassing the cache.
+        
         Returns:
             ParsedResume: Structured resume data
         """
@@ -166,6 +322,20 @@ class ResumeParser:
         # Clean up the text
         raw_text = self._clean_text(raw_text)
         
+        # Nothing to extract from an image-only document; OCR is up to the caller
+        if len(raw_text) < self.MIN_TEXT_CHARS:
+            logger.warning(
+                f"Resume text too short ({len(raw_text)} characters), "
+                f"likely an image-only file: {self.resume_path.name}"
+            )
+            return ParsedResume(
+                raw_text=raw_text,
+                filename=self.resume_path.name,
+                format=file_format,
+                word_count=len(raw_text.split()),
+                needs_ocr=True,
+            )
+        
         # Extract structured information
         sections = self._extract_sections(raw_text)
         contact_info = self._extract_contact_info(raw_text)
@@ -197,25 +367,30 @@ class ResumeParser:
         """
         logger.debug(f"Parsing PDF: {self.resume_path}")
         
-        try:
-            import fitz  # PyMuPDF
-        except ImportError:
+        if not _PDF_AVAILABLE:
             logger.error("PyMuPDF not installed. Run: pip install pymupdf")
             raise ImportError("PyMuPDF is required for PDF parsing. Install with: pip install pymupdf")
         
-        text_parts = []
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         try:
-            with fitz.open(self.resume_path) as doc:
-                logger.debug(f"PDF has {len(doc)} pages")
-                
-                for page_num, page in enumerate(doc):
-                    page_text = page.get_text("text")
-                    text_parts.append(page_text)
-                    logger.debug(f"Page {page_num + 1}: {len(page_text)} characters")
+            if self.resume_path.stat().st_size >= self.MMAP_MIN_BYTES:
+                # Large files (embedded images) are mapped rather than read
+                with open(self.resume_path, "rb") as fh, \
+                        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        with fitz.open(stream=view, filetype="pdf") as doc:
+                            text_parts = self._extract_pdf_pages(doc, debug)
+                    finally:
+                        view.release()
+            else:
+                with fitz.open(self.resume_path) as doc:
+                    text_parts = self._extract_pdf_pages(doc, debug)
             
             full_text = "\n".join(text_parts)
-            logger.debug(f"Total extracted: {len(full_text)} characters")
+            if debug:
+                logger.debug(f"Total extracted: {len(full_text)} characters")
             
             return full_text
             
@@ -223,6 +398,32 @@ class ResumeParser:
             logger.error(f"Failed to parse PDF: {e}")
             raise RuntimeError(f"Failed to parse PDF file: {e}")
     
+    def _extract_pdf_pages(self, doc, debug: bool) -> list[str]:
+        """
+        Extract the text of every page of an open PyMuPDF document.
+        
+        Args:
+            doc: Open fitz.Document
+            debug: Whether per-page debug logging is enabled
+            
+        Returns:
+            list[str]: Text of each page, in page order
+        """
+        page_count = doc.page_count
+        if debug:
+            logger.debug(f"PDF has {page_count} pages")
+        
+        text_parts = [""] * page_count
+        for page_num in range(page_count):
+            # Text blocks come back in MuPDF's reading order, so joining them
+            # gives the same text as get_text("text"); image blocks are skipped
+            blocks = doc[page_num].get_text("blocks")
+            text_parts[page_num] = "".join([block[4] for block in blocks if block[6] == 0])
+            if debug:
+                logger.debug(f"Page {page_num + 1}: {len(text_parts[page_num])} characters")
+        
+        return text_parts
+    
     def _parse_docx(self) -> str:
         """
         Extract text from DOCX file using python-docx.
@@ -232,14 +433,12 @@ class ResumeParser:
         """
         logger.debug(f"Parsing DOCX: {self.resume_path}")
         
-        try:
-            from docx import Document
-        except ImportError:
+        if not _DOCX_AVAILABLE:
             logger.error("python-docx not installed. Run: pip install python-docx")
             raise ImportError("python-docx is required for DOCX parsing. Install with: pip install python-docx")
         
         try:
-            doc = Document(self.resume_path)
+            doc = Document(BytesIO(self.resume_path.read_bytes()))
             
             text_parts = []
             
@@ -277,18 +476,14 @@ class ResumeParser:
         Returns:
             str: Cleaned text
         """
-        # Replace multiple whitespaces with single space
-        text = re.sub(r"[ \t]+", " ", text)
+        # Remove any null characters or other problematic chars
+        text = text.translate(_CLEAN_TABLE)
         
         # Replace multiple newlines with double newline
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         
-        # Strip lines
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(lines)
-        
-        # Remove any null characters or other problematic chars
-        text = text.replace("\x00", "")
+        # Strip lines and collapse whitespace runs to a single space, in one pass
+        text = "\n".join([" ".join(line.split()) for line in text.split("\n")])
         
         return text.strip()
     
@@ -305,45 +500,45 @@ class ResumeParser:
         logger.debug("Extracting resume sections")
         
         sections = {}
-        lines = text.split("\n")
         
+        # Sections are sliced out of the text by offset: section_start is where
+        # the current section's content begins, line_start where this line does
         current_section = "header"
-        current_content = []
+        section_start = 0
+        line_start = 0
         
-        for line in lines:
-            line_stripped = line.strip()
+        # Lines of cleaned text are already stripped by _clean_text
+        for line in text.split("\n"):
+            next_start = line_start + len(line) + 1
             
-            # Check if this line is a section header
+            # Check if this line is a section header. Section patterns all
+            # start with a letter, so bullets, dates and blank lines skip the regex.
             is_header = False
-            header_name = None
             
-            for pattern in self.SECTION_PATTERNS:
-                if re.match(pattern, line_stripped):
-                    is_header = True
-                    header_name = line_stripped.lower()
-                    break
+            if line[:1].isalpha() and self._SECTION_RE.match(line):
+                is_header = True
             
             # Also check for all-caps lines that might be headers
-            if not is_header and line_stripped.isupper() and 2 <= len(line_stripped.split()) <= 5:
+            elif line.isupper() and 2 <= len(line.split()) <= 5:
                 is_header = True
-                header_name = line_stripped.lower()
             
-            if is_header and header_name:
-                # Save previous section
-                if current_content:
-                    sections[current_section] = "\n".join(current_content).strip()
+            if is_header:
+                # Save previous section, if it has any lines
+                if line_start > section_start:
+                    sections[current_section] = text[section_start:line_start].strip()
                 
                 # Start new section
-                current_section = header_name
-                current_content = []
-            else:
-                current_content.append(line)
+                current_section = line.lower()
+                section_start = next_start
+            
+            line_start = next_start
         
         # Don't forget the last section
-        if current_content:
-            sections[current_section] = "\n".join(current_content).strip()
+        if line_start > section_start:
+            sections[current_section] = text[section_start:].strip()
         
-        logger.debug(f"Found {len(sections)} sections: {list(sections.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(sections)} sections: {list(sections.keys())}")
         
         return sections
     
@@ -352,7 +547,7 @@ class ResumeParser:
         Extract contact information from resume text.
         
         Args:
-            text: Resume text
+            text: Cleaned resume text
             
         Returns:
             ContactInfo: Extracted contact details
@@ -361,47 +556,47 @@ class ResumeParser:
         
         contact = ContactInfo()
         
+        # Contact details sit at the top of a resume, so search the leading
+        # lines first and only scan the rest of the text on a miss
+        if len(text) <= self.CONTACT_HEAD_CHARS:
+            head_end = len(text)
+        else:
+            head_end = max(text.rfind("\n", 0, self.CONTACT_HEAD_CHARS), 0)
+        
         # Email pattern
-        email_match = re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
+        email_match = _search_from_head(_EMAIL_RE, text, head_end)
         if email_match:
             contact.email = email_match.group()
             logger.debug(f"Found email: {contact.email}")
         
         # Phone pattern (various formats)
-        phone_patterns = [
-            r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # (123) 456-7890 or 123-456-7890
-            r"\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # +1 (123) 456-7890
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
-            if phone_match:
-                contact.phone = phone_match.group()
-                logger.debug(f"Found phone: {contact.phone}")
-                break
+        phone_match = _search_from_head(_PHONE_RE, text, head_end)
+        if phone_match:
+            contact.phone = phone_match.group()
+            logger.debug(f"Found phone: {contact.phone}")
         
         # LinkedIn pattern
-        linkedin_match = re.search(r"linkedin\.com/in/[\w-]+", text, re.IGNORECASE)
+        linkedin_match = _search_from_head(_LINKEDIN_RE, text, head_end)
         if linkedin_match:
             contact.linkedin = linkedin_match.group()
             logger.debug(f"Found LinkedIn: {contact.linkedin}")
         
         # GitHub pattern
-        github_match = re.search(r"github\.com/[\w-]+", text, re.IGNORECASE)
+        github_match = _search_from_head(_GITHUB_RE, text, head_end)
         if github_match:
             contact.github = github_match.group()
             logger.debug(f"Found GitHub: {contact.github}")
         
-        # Try to extract name (usually first non-empty line)
-        lines = [l.strip() for l in text.split("\n") if l.strip()]
-        if lines:
-            # First line is often the name
-            potential_name = lines[0]
+        # Try to extract name (usually first non-empty line). Cleaned text is
+        # stripped, so its first line is the first non-empty one.
+        potential_name = text.partition("\n")[0]
+        if potential_name:
             # Check if it looks like a name (not email, not too long, contains letters)
             if (
                 "@" not in potential_name
                 and len(potential_name) < 50
-                and re.search(r"[a-zA-Z]", potential_name)
-                and not re.match(r"^\d", potential_name)
+                and _LETTER_RE.search(potential_name)
+                and not _LEADING_DIGIT_RE.match(potential_name)
             ):
                 contact.name = potential_name
                 logger.debug(f"Found name: {contact.name}")
@@ -421,48 +616,30 @@ class ResumeParser:
         """
         logger.debug("Extracting skills")
         
-        skills = set()
-        
-        # Common technical skills to look for
-        tech_skills = [
-            # Programming languages
-            r"python", r"javascript", r"typescript", r"java\b", r"c\+\+", r"c#", r"ruby", r"go\b",
-            r"rust", r"php", r"swift", r"kotlin", r"scala", r"r\b", r"matlab", r"perl",
-            # Web technologies
-            r"html5?", r"css3?", r"react(?:\.?js)?", r"angular", r"vue(?:\.?js)?", r"node\.?js", r"express",
-            r"django", r"flask", r"fastapi", r"spring\b", r"asp\.?net", r"next\.?js", r"nuxt",
-            # Databases
-            r"sql\b", r"mysql", r"postgresql", r"postgres", r"mongodb", r"redis", r"elasticsearch",
-            r"dynamodb", r"cassandra", r"oracle", r"sqlite", r"mariadb",
-            # Cloud & DevOps
-            r"aws", r"amazon web services", r"azure", r"gcp", r"google cloud", 
-            r"docker", r"kubernetes", r"k8s", r"terraform", r"ansible", r"jenkins", 
-            r"ci/?cd", r"github actions", r"gitlab", r"circleci",
-            # Data & ML
-            r"machine learning", r"deep learning", r"tensorflow", r"pytorch", r"keras",
-            r"pandas", r"numpy", r"scikit-learn", r"sklearn", r"nlp", r"computer vision",
-            r"data science", r"data analytics", r"big data", r"spark", r"hadoop",
-            # Tools & Others
-            r"git\b", r"linux", r"unix", r"bash", r"shell", r"agile", r"scrum", r"jira",
-            r"rest\s?api", r"graphql", r"microservices", r"api design", r"system design",
-            r"oauth", r"jwt", r"websocket",
-        ]
-        
         # Search in skills section first, then full text
         search_text = skills_section if skills_section else full_text
-        search_text_lower = search_text.lower()
-        
-        for skill_pattern in tech_skills:
-            if re.search(rf"\b{skill_pattern}\b", search_text_lower, re.IGNORECASE):
-                # Clean up the skill name for display
-                skill_clean = skill_pattern.replace(r"\b", "").replace(r"\.", ".").replace(r"\s?", " ").replace(r"\+", "+").replace("?", "")
-                # Normalize
-                if len(skill_clean) <= 4:
-                    skills.add(skill_clean.upper())
-                else:
-                    skills.add(skill_clean.title())
-        
-        skills_list = sorted(list(skills))
+        if not search_text:
+            return []
+        
+        skills = {_SKILL_NAMES[m.lastgroup] for m in _SKILL_RE.finditer(search_text.lower())}
+        
+        skills_list = sorted(skills)
         logger.debug(f"Found {len(skills_list)} skills")
         
         return skills_list
+
+
+@lru_cache(maxsize=8)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> ParsedResume:
+    """
+    Parse a resume file, memoized on its path, modification time and size.
+    
+    Args:
+        path: Resume file path
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        ParsedResume: Structured resume data
+    """
+    return ResumeParser(Path(path))._parse_file()
@@ -0,0 +1,134 @@
+"""Tests for the API endpoints, with the resume parser and Gemini stubbed."""
+
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from services.document_gen import GeneratedDocument
+from services.gemini_service import TailoredContent
+
+
+TAILORED = TailoredContent(
+    tailored_text="Jane Doe\nPython",
+    summary="Emphasized Python.",
+    matched_keywords=["Python"],
+    ats_score=80,
+)
+
+
+class _StubGemini:
+    def tailor_resume_stream(self, **kwargs):
+        yield "TAILORED_RESUME", "Jane Doe\n"
+        yield "TAILORED_RESUME", "Python"
+        yield "complete", TAILORED
+    
+    async def tailor_resume_async(self, **kwargs):
+        return TAILORED
+
+
+class _StubDocGenerator:
+    def generate(self, content, formats, **kwargs):
+        return [
+            GeneratedDocument(
+                path=Path(f"/tmp/resume.{fmt}"),
+                format=fmt,
+                filename=f"resume.{fmt}",
+                size_bytes=len(content),
+                created_at=datetime.now(),
+            )
+            for fmt in formats
+        ]
+
+
+@pytest.fixture
+def parsed():
+    return SimpleNamespace(
+        raw_text="Jane Doe\nPython developer " * 10,
+        word_count=30,
+        skills=["Python"],
+        contact_info=None,
+        needs_ocr=False,
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, parsed):
+    monkeypatch.setattr(app_module, "_parse_resume", lambda path: parsed)
+    monkeypatch.setattr(app_module, "_get_gemini", lambda *args: _StubGemini())
+    monkeypatch.setattr(app_module, "_get_doc_generator", lambda path: _StubDocGenerator())
+    return TestClient(app_module.app)
+
+
+TAILOR_BODY = {
+    "job_description": "Senior Python Engineer. Requirements: Python, FastAPI, AWS.",
+    "output_formats": ["docx"],
+}
+
+
+def test_tailor_stream_forwards_sections_before_complete(client):
+    response = client.post("/tailor/stream", json=TAILOR_BODY)
+    assert response.status_code == 200
+    events = [orjson.loads(line) for line in response.text.splitlines()]
+    
+    stages = [event["stage"] for event in events]
+    assert stages == ["accepted", "parsed", "section", "section", "tailored", "generated", "complete"]
+    assert [e["data"] for e in events if e["stage"] == "section"] == [
+        {"section": "TAILORED_RESUME", "text": "Jane Doe\n"},
+        {"section": "TAILORED_RESUME", "text": "Python"},
+    ]
+    assert events[-1]["data"]["tailored_content"] == "Jane Doe\nPython"
+
+
+def test_tailor_returns_complete_response(client):
+    response = client.post("/tailor", json=TAILOR_BODY)
+    assert response.status_code == 200
+    assert response.json()["ats_score"] == 80
+
+
+def test_tailor_rejects_scanned_resume_before_calling_gemini(client, parsed, monkeypatch):
+    parsed.needs_ocr = True
+    monkeypatch.setattr(_StubGemini, "tailor_resume_async", None)
+    
+    response = client.post("/tailor", json=TAILOR_BODY)
+    assert response.status_code == 422
+    body = response.json()
+    assert body["error"] == "RESUME_PARSE_ERROR"
+    assert "OCR required" in body["message"]
+
+
+def test_gemini_service_follows_cache_and_tier_settings(monkeypatch):
+    monkeypatch.setattr(app_module.settings, "semantic_cache_threshold", None)
+    monkeypatch.setattr(app_module.settings, "gemini_model_tiers", None)
+    app_module._get_gemini.cache_clear()
+    first = app_module._current_gemini()
+    assert app_module._current_gemini() is first
+    
+    monkeypatch.setattr(app_module.settings, "semantic_cache_threshold", 0.9)
+    monkeypatch.setattr(app_module.settings, "gemini_model_tiers", ["gemini-1.5-flash-8b"])
+    second = app_module._current_gemini()
+    assert second is not first
+    assert second._sem_cache.threshold == 0.9
+    assert second.model_tiers[0] == "gemini-1.5-flash-8b"
+    app_module._get_gemini.cache_clear()
+
+
+def test_config_etag_round_trip(client):
+    first = client.get("/config")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        response = client.get("/config", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    stale = client.get("/config", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == first.content
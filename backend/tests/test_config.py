@@ -0,0 +1,65 @@
+"""Tests for the configuration stat cache."""
+
+import config
+from config import Settings, invalidate_stat_cache
+
+
+def _settings(tmp_path, filename="resume.pdf"):
+    (tmp_path / "resume").mkdir(exist_ok=True)
+    return Settings(_env_file=None, base_dir=tmp_path, resume_filename=filename)
+
+
+def test_get_resume_info_reuses_dict_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STAT_CACHE_TTL", 0)
+    settings = _settings(tmp_path)
+    resume = tmp_path / "resume" / "resume.pdf"
+    resume.write_bytes(b"%PDF")
+    invalidate_stat_cache()
+    
+    first = settings.get_resume_info()
+    assert first["exists"] and first["size_bytes"] == 4
+    assert settings.get_resume_info() is first
+    
+    resume.write_bytes(b"%PDF-1.7")
+    changed = settings.get_resume_info()
+    assert changed is not first
+    assert changed["size_bytes"] == 8
+
+
+def test_invalidation_during_lookup_is_not_overwritten(tmp_path, monkeypatch):
+    # With a watcher running, cached info never expires on its own
+    monkeypatch.setattr(config, "_resume_observer", object())
+    settings = _settings(tmp_path)
+    resume = tmp_path / "resume" / "resume.pdf"
+    resume.write_bytes(b"%PDF")
+    invalidate_stat_cache()
+    
+    stat_resume = Settings._stat_resume
+    
+    def racing_stat(self):
+        # The change event lands after the old file was stat'ed
+        result = stat_resume(self)
+        resume.write_bytes(b"%PDF-1.7")
+        invalidate_stat_cache()
+        return result
+    
+    monkeypatch.setattr(Settings, "_stat_resume", racing_stat)
+    assert settings.get_resume_info()["size_bytes"] == 4
+    monkeypatch.setattr(Settings, "_stat_resume", stat_resume)
+    
+    assert settings.get_resume_info()["size_bytes"] == 8
+
+
+def test_watcher_event_invalidates_cached_info(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "_resume_observer", object())
+    settings = _settings(tmp_path)
+    resume = tmp_path / "resume" / "resume.pdf"
+    resume.write_bytes(b"%PDF")
+    invalidate_stat_cache()
+    
+    assert settings.get_resume_info()["size_bytes"] == 4
+    resume.write_bytes(b"%PDF-1.7")
+    assert settings.get_resume_info()["size_bytes"] == 4
+    
+    config._InvalidateOnChange().on_any_event(None)
+    assert settings.get_resume_info()["size_bytes"] == 8
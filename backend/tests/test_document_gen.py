@@ -0,0 +1,66 @@
+"""Tests for generated-file housekeeping in the document generator."""
+
+import os
+
+import pytest
+
+from services.document_gen import DocumentGenerator
+
+
+@pytest.fixture
+def generator(tmp_path):
+    # Five generated files, oldest first, plus files that aren't ours
+    for age, name in enumerate(reversed([
+        "resume_tailored_a.pdf",
+        "resume_tailored_b.docx",
+        "resume_tailored_c.pdf",
+        "resume_tailored_d.docx",
+        "resume_tailored_e.pdf",
+    ])):
+        path = tmp_path / name
+        path.write_bytes(b"x" * (age + 1))
+        mtime = 1_700_000_000 - age * 60
+        os.utime(path, (mtime, mtime))
+    (tmp_path / "notes.txt").write_text("keep me")
+    (tmp_path / "resume_tailored_dir").mkdir()
+    return DocumentGenerator(tmp_path)
+
+
+def _remaining(generator):
+    return sorted(f["filename"] for f in generator.list_generated_files())
+
+
+def test_list_generated_files_newest_first(generator):
+    files = generator.list_generated_files()
+    
+    assert [f["filename"] for f in files] == [
+        "resume_tailored_e.pdf",
+        "resume_tailored_d.docx",
+        "resume_tailored_c.pdf",
+        "resume_tailored_b.docx",
+        "resume_tailored_a.pdf",
+    ]
+    assert files[0]["format"] == "pdf"
+    assert files[0]["size_bytes"] == 1
+
+
+def test_cleanup_keeps_newest_files(generator):
+    assert generator.cleanup_old_files(keep_count=2) == 3
+    assert _remaining(generator) == ["resume_tailored_d.docx", "resume_tailored_e.pdf"]
+    assert (generator.output_dir / "notes.txt").exists()
+
+
+def test_cleanup_keep_zero_deletes_all_generated_files(generator):
+    assert generator.cleanup_old_files(keep_count=0) == 5
+    assert _remaining(generator) == []
+    assert (generator.output_dir / "notes.txt").exists()
+    assert (generator.output_dir / "resume_tailored_dir").is_dir()
+
+
+def test_cleanup_with_fewer_files_than_keep_count_is_a_no_op(generator):
+    assert generator.cleanup_old_files(keep_count=10) == 0
+    assert len(_remaining(generator)) == 5
+
+
+def test_cleanup_clamps_negative_keep_count(generator):
+    assert generator.cleanup_old_files(keep_count=-3) == 5
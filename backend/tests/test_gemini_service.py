@@ -0,0 +1,169 @@
+"""Tests for Gemini prompt preprocessing."""
+
+import sys
+from types import SimpleNamespace
+
+from services import gemini_service
+from services.gemini_service import (
+    GeminiService,
+    TailoredContent,
+    _SectionStreamParser,
+    _SemanticCache,
+    _strip_boilerplate,
+)
+
+
+def test_strip_boilerplate_keeps_requirements_without_blank_lines():
+    job_description = (
+        "Acme is an equal opportunity employer hiring a Senior Python Engineer.\n"
+        "Requirements:\n"
+        "- 5+ years Python\n"
+        "- FastAPI, AWS\n"
+        "Responsibilities:\n"
+        "- Build APIs"
+    )
+    assert _strip_boilerplate(job_description) == job_description
+
+
+def test_strip_boilerplate_drops_only_trailing_statement_lines():
+    job_description = (
+        "Senior Python Engineer\n"
+        "Requirements:\n"
+        "- 5+ years Python\n"
+        "- FastAPI, AWS\n"
+        "Responsibilities:\n"
+        "- Build APIs\n"
+        "- Provide reasonable accommodations to customers\n"
+        "Acme is an Equal Employment Opportunity employer.\n"
+        "We offer remote work."
+    )
+    stripped = _strip_boilerplate(job_description)
+    assert "Equal Employment Opportunity" not in stripped
+    assert "- 5+ years Python\n- FastAPI, AWS\n" in stripped
+    assert "- Build APIs\n" in stripped
+    assert stripped.endswith("We offer remote work.")
+
+
+class _FlakyStreamModel:
+    """Fake model whose first streaming request fails transiently."""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.calls = []
+    
+    def generate_content(self, prompt, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.calls) == 1:
+            raise ConnectionError("503 Service Unavailable")
+        return iter(SimpleNamespace(text=chunk) for chunk in self.chunks)
+
+
+def test_tailor_resume_stream_retries_initial_request(monkeypatch):
+    model = _FlakyStreamModel([
+        "<TAILORED_RESUME>Jane Doe\nPython</TAILORED_RESUME>",
+        "<SUMMARY>Emphasized Python.</SUMMARY><ATS_SCORE>80</ATS_SCORE>",
+    ])
+    service = GeminiService(api_key="test-key")
+    service.RETRY_BASE_DELAY = 0
+    monkeypatch.setattr(gemini_service, "_transient_errors", lambda: (ConnectionError,))
+    monkeypatch.setattr(service, "_prepare_tailor", lambda *args: ("prompt", b"key", None, None))
+    monkeypatch.setattr(service, "_get_tailor_model", lambda name: model)
+    
+    events = list(service.tailor_resume_stream("resume", "job description"))
+    
+    assert model.calls == [{"stream": True}, {"stream": True}]
+    assert ("TAILORED_RESUME", "Jane Doe\nPython") in events
+    stage, result = events[-1]
+    assert stage == "complete"
+    assert result.tailored_text == "Jane Doe\nPython"
+
+
+class _StubEncoder:
+    """Embeds a prompt as a fixed unit vector looked up by its text."""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+    
+    def encode(self, prompts, normalize_embeddings=True):
+        return [self.vectors[prompt] for prompt in prompts]
+
+
+class _StubIndex:
+    """Inner-product index over plain lists, shaped like faiss.IndexFlatIP."""
+    
+    def __init__(self):
+        self.rows = []
+    
+    def add(self, vectors):
+        self.rows.extend(vectors)
+    
+    def reset(self):
+        self.rows.clear()
+    
+    def search(self, vectors, k):
+        query = vectors[0]
+        scores = [sum(a * b for a, b in zip(query, row)) for row in self.rows]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return [[scores[best]]], [[best]]
+
+
+def _semantic_cache(threshold, vectors):
+    cache = _SemanticCache(threshold)
+    cache._encoder = _StubEncoder(vectors)
+    cache._index = _StubIndex()
+    return cache
+
+
+def test_semantic_cache_hits_only_at_or_above_threshold():
+    cache = _semantic_cache(0.9, {
+        "stored": [1.0, 0.0],
+        "close": [0.95, 0.31],
+        "far": [0.6, 0.8],
+    })
+    stored = TailoredContent(tailored_text="stored")
+    
+    assert cache.lookup("stored") == (None, [[1.0, 0.0]])
+    cache.add([[1.0, 0.0]], stored)
+    
+    assert cache.lookup("close")[0] is stored
+    assert cache.lookup("far") == (None, [[0.6, 0.8]])
+
+
+def test_semantic_cache_starts_over_when_full(monkeypatch):
+    monkeypatch.setattr(_SemanticCache, "MAX_ENTRIES", 2)
+    cache = _semantic_cache(0.9, {"a": [1.0, 0.0], "b": [0.0, 1.0]})
+    first = TailoredContent(tailored_text="a")
+    
+    cache.add([[1.0, 0.0]], first)
+    cache.add([[0.0, 1.0]], TailoredContent(tailored_text="b"))
+    assert cache.lookup("a")[0] is first
+    
+    cache.add([[0.0, 1.0]], TailoredContent(tailored_text="b2"))
+    assert cache.lookup("a")[0] is None
+    assert cache.lookup("b")[0].tailored_text == "b2"
+
+
+def test_semantic_cache_disables_itself_without_faiss(monkeypatch):
+    monkeypatch.setitem(sys.modules, "faiss", None)
+    cache = _SemanticCache(0.9)
+    
+    assert cache.lookup("prompt") == (None, None)
+    assert not cache.enabled
+    cache.add(None, TailoredContent(tailored_text="ignored"))
+
+
+def test_section_stream_parser_handles_tags_split_across_chunks():
+    parser = _SectionStreamParser()
+    pieces = []
+    for chunk in [
+        "<TAILORED_RES", "UME>Jane ", "Doe</TAILORED_RESUME><SUMM", "ARY>Short<", "/SUMMARY>",
+    ]:
+        pieces += parser.feed(chunk)
+    pieces += parser.close()
+    
+    assert pieces == [
+        ("TAILORED_RESUME", "Jane "),
+        ("TAILORED_RESUME", "Doe"),
+        ("SUMMARY", "Short"),
+    ]
+    assert parser.text == "<TAILORED_RESUME>Jane Doe</TAILORED_RESUME><SUMMARY>Short</SUMMARY>"
@@ -0,0 +1,36 @@
+"""Tests for the buffered rotating log handler."""
+
+import logging
+import time
+
+from logger import BufferedRotatingFileHandler
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_buffered_handler_flushes_on_size(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = BufferedRotatingFileHandler(log_file, flush_bytes=10, flush_interval=60)
+    try:
+        handler.emit(_record("short"))
+        assert log_file.read_text() == ""
+        handler.emit(_record("long enough"))
+        assert log_file.read_text() == "short\nlong enough\n"
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_flushes_after_interval(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = BufferedRotatingFileHandler(log_file, flush_bytes=1 << 20, flush_interval=0.05)
+    try:
+        handler.emit(_record("queued"))
+        assert log_file.read_text() == ""
+        deadline = time.monotonic() + 2
+        while not log_file.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log_file.read_text() == "queued\n"
+    finally:
+        handler.close()
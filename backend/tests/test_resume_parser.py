@@ -0,0 +1,121 @@
+"""Tests for resume parsing, with text extraction stubbed."""
+
+import re
+
+import pytest
+
+from services import resume_parser
+from services.resume_parser import ResumeParser
+
+
+RESUME_TEXT = """Jane Doe
+jane@example.com | (555) 123-4567
+
+Summary
+Backend engineer building APIs.
+
+Experience
+Acme Corp - Senior Engineer
+Built FastAPI services on AWS.
+
+Skills
+Python, FastAPI, Docker, PostgreSQL
+"""
+
+
+@pytest.fixture
+def resume_file(tmp_path, monkeypatch):
+    calls = []
+    
+    def fake_parse_pdf(self):
+        calls.append(self.resume_path)
+        return RESUME_TEXT
+    
+    monkeypatch.setattr(ResumeParser, "_parse_pdf", fake_parse_pdf)
+    resume_parser._parse_cached.cache_clear()
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF")
+    yield path, calls
+    resume_parser._parse_cached.cache_clear()
+
+
+def test_parse_returns_independent_copies_of_cached_result(resume_file):
+    path, calls = resume_file
+    
+    first = ResumeParser(path).parse()
+    second = ResumeParser(path).parse()
+    
+    assert len(calls) == 1
+    assert first == second
+    assert first.sections is not second.sections
+    
+    first.sections["summary"] = "changed"
+    first.skills.append("cobol")
+    first.contact_info.name = "Someone Else"
+    
+    third = ResumeParser(path).parse()
+    assert third == second
+    assert third.contact_info.name == "Jane Doe"
+    assert "cobol" not in third.skills
+
+
+# The single-alternation regexes must match exactly what the original
+# one-pattern-at-a-time searches did
+
+SKILL_TEXTS = [
+    "python, javascript and typescript; java 17",
+    "c++ / c# / go / r and rust",
+    "react.js, reactjs, react, vue, node.js, nodejs, next.js",
+    "postgresql and postgres, mysql, sql server, sqlite",
+    "aws (amazon web services), gcp, google cloud, k8s, ci/cd, cicd",
+    "rest api design, restapi, system design, github actions",
+    "scikit-learn, sklearn, nlp, big data, spark",
+    "git, github, gitlab, bash shell scripting, linux/unix",
+    "expressive gorilla golang sparkle",
+]
+
+
+@pytest.mark.parametrize("text", SKILL_TEXTS)
+def test_skill_alternation_matches_per_pattern_search(text):
+    expected = {
+        name
+        for name, pattern in resume_parser._SKILL_GROUPS
+        if re.search(rf"\b{pattern}\b", text)
+    }
+    found = {
+        resume_parser._SKILL_NAMES[m.lastgroup]
+        for m in resume_parser._SKILL_RE.finditer(text)
+    }
+    assert found == expected
+
+
+def test_extract_skills_reports_overlapping_mentions():
+    parser = ResumeParser.__new__(ResumeParser)
+    skills = parser._extract_skills("", "REST API design with Java 17")
+    assert skills == ["Api Design", "JAVA", "Rest Api"]
+
+
+SECTION_LINES = [
+    "Summary", "Professional Summary", "PROFESSIONAL EXPERIENCE", "Experience",
+    "Work History", "history of art", "Employment", "Education",
+    "Technical Skills", "Skills & Tools", "Core Competencies", "Certification",
+    "Notable Projects", "Project", "Awards and Honors", "Volunteering",
+    "Courses", "Profiled in Forbes", "Jane Doe", "Senior Engineer", "Python, AWS",
+]
+
+
+@pytest.mark.parametrize("line", SECTION_LINES)
+def test_section_alternation_matches_per_pattern_search(line):
+    expected = any(re.match(p, line) for p in ResumeParser.SECTION_PATTERNS)
+    assert bool(ResumeParser._SECTION_RE.match(line)) == expected
+
+
+def test_extract_sections_splits_on_headers(resume_file):
+    path, _ = resume_file
+    
+    parsed = ResumeParser(path).parse()
+    
+    assert list(parsed.sections) == ["header", "summary", "experience", "skills"]
+    assert parsed.sections["summary"] == "Backend engineer building APIs."
+    assert parsed.sections["skills"] == "Python, FastAPI, Docker, PostgreSQL"
+    assert parsed.skills == ["Docker", "Fastapi", "Postgresql", "Python"]
@@ -7,13 +7,24 @@ Run: python test_docx_generator.py
 Output: test_resume.docx
 """
 
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from xml.sax.saxutils import escape as xml_escape
+
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor, Twips
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.enum.text import WD_TAB_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
+from docx.styles.style import StyleFactory
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn, nsmap
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsmap, nsdecls
+from docx.oxml import parse_xml
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for writing finished documents off the caller's thread
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="docx-save")
 
 
 # ============================================================
@@ -143,7 +154,26 @@ class ResumeStyle:
     SECTION_SPACE_AFTER = Pt(6)
     ENTRY_SPACE_BEFORE = Pt(8)
     PARAGRAPH_SPACE_AFTER = Pt(2)
+    NO_SPACE = Pt(0)
+    FIRST_ENTRY_SPACE_BEFORE = Pt(2)
+    NAME_SPACE_AFTER = Pt(4)
+    LINKS_SPACE_AFTER = Pt(6)
+    SUMMARY_SPACE_AFTER = Pt(4)
+    BULLET_SPACE_AFTER = Pt(1)
+    BULLET_INDENT = Inches(0.25)
     LINE_SPACING = 1.15
+    RIGHT_TAB_POSITION = Inches(7.3)  # Right column of two-column rows
+    
+    # Character styles: name -> (size, bold, italic, color)
+    RUN_STYLES = {
+        "OR_Name": (NAME_SIZE, True, False, COLOR_PRIMARY),
+        "OR_Contact": (CONTACT_SIZE, False, False, COLOR_SECONDARY),
+        "OR_SectionHeader": (SECTION_HEADER_SIZE, True, False, COLOR_ACCENT),
+        "OR_Content": (CONTENT_SIZE, False, False, None),
+        "OR_ContentBold": (CONTENT_SIZE, True, False, None),
+        "OR_Small": (SMALL_SIZE, False, False, COLOR_SECONDARY),
+        "OR_SmallItalic": (SMALL_SIZE, False, True, COLOR_SECONDARY),
+    }
 
 
 # ============================================================
@@ -153,10 +183,63 @@ class ResumeStyle:
 class OpenResumeStyleGenerator:
     """Generates DOCX resume in Open-Resume style."""
     
+    # Optional resume sections in document order: (data key, add_* method)
+    _SECTIONS = (
+        ('professional_summary', 'add_summary'),
+        ('work_experiences', 'add_experience'),
+        ('education', 'add_education'),
+        ('projects', 'add_projects'),
+        ('skills', 'add_skills'),
+        ('certifications', 'add_certifications'),
+    )
+    
+    # Skill categories in display order: (skills key, label)
+    _SKILL_CATEGORIES = (
+        ('languages', 'Languages'),
+        ('frameworks', 'Frameworks'),
+        ('tools', 'Tools'),
+        ('other', 'Other'),
+    )
+    
+    # Section header border: single line, 6 = thickness in eighths of
+    # a point, dark blue
+    _BOTTOM_BORDER = (
+        '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="2C3E50"/></w:pBdr>'
+    )
+    
+    # Configured starting document shared by all instances, built by the
+    # first one: (package bytes, run templates, paragraph properties)
+    _template = None
+    
     def __init__(self):
-        self.doc = Document()
         self.style = ResumeStyle()
-        self._setup_document()
+        
+        # Paragraph markup is buffered here and parsed into the body in one
+        # pass before the body's section properties (see _flush_body)
+        self._body_xml = []
+        
+        template = OpenResumeStyleGenerator._template
+        if template is None:
+            self.doc = Document()
+            self._setup_document()
+            
+            self._build_markup()
+            
+            buffer = BytesIO()
+            self.doc.save(buffer)
+            OpenResumeStyleGenerator._template = (
+                buffer.getvalue(), self._run_templates, self._ppr
+            )
+        else:
+            package_bytes, self._run_templates, self._ppr = template
+            self.doc = Document(BytesIO(package_bytes))
+        
+        self._body_end = self.doc.element.body.get_or_add_sectPr()
+        
+        # Whole bullet paragraph, with only the escaped text left to fill in
+        self._bullet_template = (
+            f'<w:p>{self._ppr["bullet"]}{self._run_templates["OR_Content"]}</w:p>'
+        )
     
     def _setup_document(self):
         """Configure document margins and default styles."""
@@ -168,41 +251,160 @@ class OpenResumeStyleGenerator:
             section.right_margin = self.style.PAGE_RIGHT_MARGIN
         
         # Configure default paragraph style
+        styles_element = self.doc.styles.element
         style = self.doc.styles['Normal']
         style.font.name = self.style.FONT_PRIMARY
         style.font.size = self.style.CONTENT_SIZE
-        style.paragraph_format.space_after = Pt(0)
+        style.paragraph_format.space_after = self.style.NO_SPACE
         style.paragraph_format.line_spacing = self.style.LINE_SPACING
+        
+        # Two-column rows share one paragraph style carrying the right tab stop
+        two_col = StyleFactory(
+            styles_element.add_style_of_type("OR_TwoCol", WD_STYLE_TYPE.PARAGRAPH, False)
+        )
+        two_col.base_style = style
+        two_col.paragraph_format.tab_stops.add_tab_stop(
+            self.style.RIGHT_TAB_POSITION, WD_TAB_ALIGNMENT.RIGHT
+        )
+        self._style_ids = {"OR_TwoCol": two_col.style_id}
+        
+        # Bullets come from the template's List Bullet numbering
+        self._style_ids["List Bullet"] = self.doc.styles['List Bullet'].style_id
+        
+        # Register character styles once; runs reference them instead of
+        # setting font properties one by one. The names are new to a fresh
+        # document, so skip Styles.add_style's scan for duplicates.
+        for name, (size, bold, italic, color) in self.style.RUN_STYLES.items():
+            char_style = StyleFactory(
+                styles_element.add_style_of_type(name, WD_STYLE_TYPE.CHARACTER, False)
+            )
+            char_style.font.name = self.style.FONT_PRIMARY
+            char_style.font.size = size
+            if bold:
+                char_style.font.bold = True
+            if italic:
+                char_style.font.italic = True
+            if color is not None:
+                char_style.font.color.rgb = color
+            self._style_ids[name] = char_style.style_id
     
-    def _add_bottom_border(self, paragraph):
-        """Add a bottom border line to a paragraph (for section headers)."""
-        pPr = paragraph._p.get_or_add_pPr()
-        pBdr = OxmlElement('w:pBdr')
-        bottom = OxmlElement('w:bottom')
-        bottom.set(qn('w:val'), 'single')
-        bottom.set(qn('w:sz'), '6')  # Border thickness
-        bottom.set(qn('w:space'), '1')
-        bottom.set(qn('w:color'), '2C3E50')  # Dark blue color
-        pBdr.append(bottom)
-        pPr.append(pBdr)
-    
-    def _set_tab_stops(self, paragraph, right_tab_position=Inches(7.3)):
-        """Add right-aligned tab stop for two-column layouts."""
-        tab_stops = paragraph.paragraph_format.tab_stops
-        tab_stops.add_tab_stop(right_tab_position, WD_TAB_ALIGNMENT.RIGHT)
+    def _build_markup(self):
+        """Prebuild the run and paragraph-property markup; only text varies."""
+        style_ids = self._style_ids
+        self._run_templates = {
+            name: (
+                f'<w:r><w:rPr><w:rStyle w:val="{style_ids[name]}"/></w:rPr>'
+                '<w:t xml:space="preserve">%s</w:t></w:r>'
+            )
+            for name in self.style.RUN_STYLES
+        }
+        
+        s = self.style
+        two_col = style_ids["OR_TwoCol"]
+        ppr = self._ppr_xml
+        self._ppr = {
+            "name": ppr(after=s.NAME_SPACE_AFTER, center=True),
+            "contact": ppr(after=s.PARAGRAPH_SPACE_AFTER, center=True),
+            "links": ppr(after=s.LINKS_SPACE_AFTER, center=True),
+            "section": ppr(border=True, before=s.SECTION_SPACE_BEFORE, after=s.SECTION_SPACE_AFTER),
+            "summary": ppr(after=s.SUMMARY_SPACE_AFTER),
+            "entry_first": ppr(style_id=two_col, before=s.FIRST_ENTRY_SPACE_BEFORE,
+                               after=s.PARAGRAPH_SPACE_AFTER),
+            "entry": ppr(style_id=two_col, before=s.ENTRY_SPACE_BEFORE,
+                         after=s.PARAGRAPH_SPACE_AFTER),
+            "project_first": ppr(style_id=two_col, before=s.FIRST_ENTRY_SPACE_BEFORE,
+                                 after=s.NO_SPACE),
+            "project": ppr(style_id=two_col, before=s.ENTRY_SPACE_BEFORE, after=s.NO_SPACE),
+            "certification": ppr(style_id=two_col, after=s.PARAGRAPH_SPACE_AFTER),
+            "detail": ppr(after=s.PARAGRAPH_SPACE_AFTER),
+            "bullet": ppr(style_id=style_ids["List Bullet"], after=s.BULLET_SPACE_AFTER,
+                          indent=s.BULLET_INDENT),
+        }
+    
+    def _ppr_xml(self, style_id=None, border=False, before=None, after=None,
+                 indent=None, center=False) -> str:
+        """
+        Build <w:pPr> markup, with children in the order the schema requires.
+        
+        Args:
+            style_id: Paragraph style id, if any
+            border: Add the section header bottom border
+            before: Space before the paragraph (Length)
+            after: Space after the paragraph (Length)
+            indent: Left indent (Length)
+            center: Center-align the paragraph
+            
+        Returns:
+            pPr element markup
+        """
+        xml = '<w:pPr>'
+        if style_id:
+            xml += f'<w:pStyle w:val="{style_id}"/>'
+        if border:
+            xml += self._BOTTOM_BORDER
+        
+        spacing = ''
+        if before is not None:
+            spacing += f' w:before="{before.twips}"'
+        if after is not None:
+            spacing += f' w:after="{after.twips}"'
+        if spacing:
+            xml += f'<w:spacing{spacing}/>'
+        
+        if indent is not None:
+            xml += f'<w:ind w:left="{indent.twips}"/>'
+        if center:
+            xml += '<w:jc w:val="center"/>'
+        return xml + '</w:pPr>'
+    
+    def _add_paragraph(self, kind: str, *runs: str):
+        """
+        Buffer a paragraph built from prebuilt markup.
+        
+        Args:
+            kind: Key of the paragraph properties in self._ppr
+            runs: Run markup from _run_xml
+        """
+        self._body_xml.append(f'<w:p>{self._ppr[kind]}{"".join(runs)}</w:p>')
+    
+    def _run_xml(self, text: str, style_name: str) -> str:
+        """Build run markup referencing one of the registered character styles."""
+        return self._run_templates[style_name] % self._text_xml(text)
+    
+    @staticmethod
+    def _text_xml(text: str) -> str:
+        """Escape text for a run's <w:t>, mapping tabs/newlines like Run.text."""
+        text_xml = xml_escape(text)
+        if "\t" in text_xml or "\n" in text_xml:
+            text_xml = (
+                text_xml
+                .replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">')
+                .replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+            )
+        return text_xml
+    
+    def _flush_body(self):
+        """
+        Parse the buffered paragraphs and insert them before the sectPr.
+        
+        One lxml parse of the joined markup replaces building each paragraph,
+        run and property element through python-docx.
+        """
+        if not self._body_xml:
+            return
+        
+        fragment = parse_xml(f'<w:body {nsdecls("w")}>{"".join(self._body_xml)}</w:body>')
+        self._body_xml.clear()
+        
+        # Append in one call, then move the sectPr back to the end of the body
+        body = self.doc.element.body
+        body.extend(list(fragment))
+        body.append(self._body_end)
     
     def add_header(self, personal_info: dict):
         """Add name and contact information header."""
         # Name - Large, Bold, Centered
-        name_para = self.doc.add_paragraph()
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_para.paragraph_format.space_after = Pt(4)
-        
-        name_run = name_para.add_run(personal_info['name'])
-        name_run.bold = True
-        name_run.font.size = self.style.NAME_SIZE
-        name_run.font.name = self.style.FONT_PRIMARY
-        name_run.font.color.rgb = self.style.COLOR_PRIMARY
+        self._add_paragraph("name", self._run_xml(personal_info['name'], "OR_Name"))
         
         # Contact Info - Small, Gray, Centered
         contact_parts = []
@@ -214,14 +416,7 @@ class OpenResumeStyleGenerator:
             contact_parts.append(personal_info['location'])
         
         if contact_parts:
-            contact_para = self.doc.add_paragraph()
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_para.paragraph_format.space_after = Pt(2)
-            
-            contact_run = contact_para.add_run(" | ".join(contact_parts))
-            contact_run.font.size = self.style.CONTACT_SIZE
-            contact_run.font.name = self.style.FONT_PRIMARY
-            contact_run.font.color.rgb = self.style.COLOR_SECONDARY
+            self._add_paragraph("contact", self._run_xml(" | ".join(contact_parts), "OR_Contact"))
         
         # Links - Small, Gray, Centered (second line if needed)
         link_parts = []
@@ -233,41 +428,17 @@ class OpenResumeStyleGenerator:
             link_parts.append(personal_info['website'])
         
         if link_parts:
-            links_para = self.doc.add_paragraph()
-            links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            links_para.paragraph_format.space_after = Pt(6)
-            
-            links_run = links_para.add_run(" | ".join(link_parts))
-            links_run.font.size = self.style.CONTACT_SIZE
-            links_run.font.name = self.style.FONT_PRIMARY
-            links_run.font.color.rgb = self.style.COLOR_SECONDARY
+            self._add_paragraph("links", self._run_xml(" | ".join(link_parts), "OR_Contact"))
     
     def add_section_header(self, title: str):
         """Add a section header with bottom border."""
-        para = self.doc.add_paragraph()
-        para.paragraph_format.space_before = self.style.SECTION_SPACE_BEFORE
-        para.paragraph_format.space_after = self.style.SECTION_SPACE_AFTER
-        
-        run = para.add_run(title.upper())
-        run.bold = True
-        run.font.size = self.style.SECTION_HEADER_SIZE
-        run.font.name = self.style.FONT_PRIMARY
-        run.font.color.rgb = self.style.COLOR_ACCENT
-        
-        # Add bottom border
-        self._add_bottom_border(para)
+        self._add_paragraph("section", self._run_xml(title.upper(), "OR_SectionHeader"))
     
     def add_summary(self, summary: str):
         """Add professional summary section."""
         self.add_section_header("Professional Summary")
         
-        para = self.doc.add_paragraph()
-        para.paragraph_format.space_after = Pt(4)
-        
-        run = para.add_run(summary)
-        run.font.size = self.style.CONTENT_SIZE
-        run.font.name = self.style.FONT_PRIMARY
-        run.font.color.rgb = self.style.COLOR_PRIMARY
+        self._add_paragraph("summary", self._run_xml(summary, "OR_Content"))
     
     def add_experience(self, experiences: list):
         """Add work experience section."""
@@ -277,43 +448,19 @@ class OpenResumeStyleGenerator:
         self.add_section_header("Experience")
         
         for i, exp in enumerate(experiences):
-            # Title and Company row
-            title_para = self.doc.add_paragraph()
-            if i > 0:
-                title_para.paragraph_format.space_before = self.style.ENTRY_SPACE_BEFORE
-            else:
-                title_para.paragraph_format.space_before = Pt(2)
-            title_para.paragraph_format.space_after = Pt(0)
-            self._set_tab_stops(title_para)
-            
-            # Job Title (bold)
-            title_run = title_para.add_run(exp['title'])
-            title_run.bold = True
-            title_run.font.size = self.style.CONTENT_SIZE
-            title_run.font.name = self.style.FONT_PRIMARY
-            
-            # Tab + Company (right-aligned)
-            company_run = title_para.add_run(f"\t{exp['company']}")
-            company_run.font.size = self.style.CONTENT_SIZE
-            company_run.font.name = self.style.FONT_PRIMARY
-            
-            # Dates and Location row
-            date_para = self.doc.add_paragraph()
-            date_para.paragraph_format.space_after = Pt(2)
-            self._set_tab_stops(date_para)
-            
-            # Dates (italic)
-            date_run = date_para.add_run(f"{exp['start_date']} - {exp['end_date']}")
-            date_run.italic = True
-            date_run.font.size = self.style.SMALL_SIZE
-            date_run.font.name = self.style.FONT_PRIMARY
-            date_run.font.color.rgb = self.style.COLOR_SECONDARY
-            
-            # Tab + Location (right-aligned)
-            location_run = date_para.add_run(f"\t{exp['location']}")
-            location_run.font.size = self.style.SMALL_SIZE
-            location_run.font.name = self.style.FONT_PRIMARY
-            location_run.font.color.rgb = self.style.COLOR_SECONDARY
+            # Title/Company and Dates/Location rows share one paragraph,
+            # separated by a line break
+            self._add_paragraph(
+                "entry" if i > 0 else "entry_first",
+                # Job Title (bold)
+                self._run_xml(exp['title'], "OR_ContentBold"),
+                # Tab + Company (right-aligned)
+                self._run_xml(f"\t{exp['company']}", "OR_Content"),
+                # Line break + Dates (italic)
+                self._run_xml(f"\n{exp['start_date']} - {exp['end_date']}", "OR_SmallItalic"),
+                # Tab + Location (right-aligned)
+                self._run_xml(f"\t{exp['location']}", "OR_Small"),
+            )
             
             # Bullet points
             for bullet in exp.get('bullets', []):
@@ -327,47 +474,27 @@ class OpenResumeStyleGenerator:
         self.add_section_header("Education")
         
         for i, edu in enumerate(education):
-            # Degree and Institution row
-            degree_para = self.doc.add_paragraph()
-            if i > 0:
-                degree_para.paragraph_format.space_before = self.style.ENTRY_SPACE_BEFORE
-            else:
-                degree_para.paragraph_format.space_before = Pt(2)
-            degree_para.paragraph_format.space_after = Pt(0)
-            self._set_tab_stops(degree_para)
-            
-            # Degree (bold)
-            degree_run = degree_para.add_run(edu['degree'])
-            degree_run.bold = True
-            degree_run.font.size = self.style.CONTENT_SIZE
-            degree_run.font.name = self.style.FONT_PRIMARY
-            
-            # Tab + Institution (right-aligned)
-            inst_run = degree_para.add_run(f"\t{edu['institution']}")
-            inst_run.font.size = self.style.CONTENT_SIZE
-            inst_run.font.name = self.style.FONT_PRIMARY
-            
-            # GPA/Date and Location row
-            date_para = self.doc.add_paragraph()
-            date_para.paragraph_format.space_after = Pt(2)
-            self._set_tab_stops(date_para)
+            # Degree/Institution and GPA/Date rows share one paragraph,
+            # separated by a line break
+            runs = [
+                # Degree (bold)
+                self._run_xml(edu['degree'], "OR_ContentBold"),
+                # Tab + Institution (right-aligned)
+                self._run_xml(f"\t{edu['institution']}", "OR_Content"),
+            ]
             
-            # GPA or date info
+            # Line break + GPA or date info
             gpa_text = f"GPA: {edu['gpa']}" if edu.get('gpa') else edu.get('graduation_date', '')
-            gpa_run = date_para.add_run(gpa_text)
-            gpa_run.font.size = self.style.SMALL_SIZE
-            gpa_run.font.name = self.style.FONT_PRIMARY
-            gpa_run.font.color.rgb = self.style.COLOR_SECONDARY
+            runs.append(self._run_xml(f"\n{gpa_text}", "OR_Small"))
             
             # Tab + Location or Date (right-aligned)
             loc_text = edu.get('location', '') if edu.get('gpa') else ''
             if edu.get('gpa') and edu.get('graduation_date'):
                 loc_text = edu['graduation_date']
             if loc_text:
-                loc_run = date_para.add_run(f"\t{loc_text}")
-                loc_run.font.size = self.style.SMALL_SIZE
-                loc_run.font.name = self.style.FONT_PRIMARY
-                loc_run.font.color.rgb = self.style.COLOR_SECONDARY
+                runs.append(self._run_xml(f"\t{loc_text}", "OR_Small"))
+            
+            self._add_paragraph("entry" if i > 0 else "entry_first", *runs)
     
     def add_projects(self, projects: list):
         """Add projects section."""
@@ -377,37 +504,19 @@ class OpenResumeStyleGenerator:
         self.add_section_header("Projects")
         
         for i, proj in enumerate(projects):
-            # Project name and technologies
-            proj_para = self.doc.add_paragraph()
-            if i > 0:
-                proj_para.paragraph_format.space_before = self.style.ENTRY_SPACE_BEFORE
-            else:
-                proj_para.paragraph_format.space_before = Pt(2)
-            proj_para.paragraph_format.space_after = Pt(0)
-            self._set_tab_stops(proj_para)
-            
             # Project name (bold)
-            name_run = proj_para.add_run(proj['name'])
-            name_run.bold = True
-            name_run.font.size = self.style.CONTENT_SIZE
-            name_run.font.name = self.style.FONT_PRIMARY
+            runs = [self._run_xml(proj['name'], "OR_ContentBold")]
             
             # Technologies (right-aligned)
             if proj.get('technologies'):
                 tech_text = " | ".join(proj['technologies'])
-                tech_run = proj_para.add_run(f"\t{tech_text}")
-                tech_run.font.size = self.style.SMALL_SIZE
-                tech_run.font.name = self.style.FONT_PRIMARY
-                tech_run.font.color.rgb = self.style.COLOR_SECONDARY
+                runs.append(self._run_xml(f"\t{tech_text}", "OR_Small"))
+            
+            self._add_paragraph("project" if i > 0 else "project_first", *runs)
             
             # URL if present
             if proj.get('url'):
-                url_para = self.doc.add_paragraph()
-                url_para.paragraph_format.space_after = Pt(2)
-                url_run = url_para.add_run(proj['url'])
-                url_run.font.size = self.style.SMALL_SIZE
-                url_run.font.name = self.style.FONT_PRIMARY
-                url_run.font.color.rgb = self.style.COLOR_SECONDARY
+                self._add_paragraph("detail", self._run_xml(proj['url'], "OR_Small"))
             
             # Bullet points
             for bullet in proj.get('bullets', []):
@@ -420,33 +529,16 @@ class OpenResumeStyleGenerator:
         
         self.add_section_header("Skills")
         
-        # Combine all skills into categorized format
-        skill_lines = []
-        
-        if skills.get('languages'):
-            skill_lines.append(f"Languages: {', '.join(skills['languages'])}")
-        if skills.get('frameworks'):
-            skill_lines.append(f"Frameworks: {', '.join(skills['frameworks'])}")
-        if skills.get('tools'):
-            skill_lines.append(f"Tools: {', '.join(skills['tools'])}")
-        if skills.get('other'):
-            skill_lines.append(f"Other: {', '.join(skills['other'])}")
-        
-        for line in skill_lines:
-            para = self.doc.add_paragraph()
-            para.paragraph_format.space_after = Pt(2)
+        # One "Category: a, b, c" line per non-empty category
+        for key, label in self._SKILL_CATEGORIES:
+            if not skills.get(key):
+                continue
             
-            # Split into category and skills
-            if ': ' in line:
-                category, skill_list = line.split(': ', 1)
-                cat_run = para.add_run(f"{category}: ")
-                cat_run.bold = True
-                cat_run.font.size = self.style.CONTENT_SIZE
-                cat_run.font.name = self.style.FONT_PRIMARY
-                
-                skill_run = para.add_run(skill_list)
-                skill_run.font.size = self.style.CONTENT_SIZE
-                skill_run.font.name = self.style.FONT_PRIMARY
+            self._add_paragraph(
+                "detail",
+                self._run_xml(f"{label}: ", "OR_ContentBold"),
+                self._run_xml(', '.join(skills[key]), "OR_Content"),
+            )
     
     def add_certifications(self, certifications: list):
         """Add certifications section."""
@@ -456,74 +548,100 @@ class OpenResumeStyleGenerator:
         self.add_section_header("Certifications")
         
         for cert in certifications:
-            para = self.doc.add_paragraph()
-            para.paragraph_format.space_after = Pt(2)
-            self._set_tab_stops(para)
-            
-            # Certification name (bold)
-            name_run = para.add_run(cert['name'])
-            name_run.bold = True
-            name_run.font.size = self.style.CONTENT_SIZE
-            name_run.font.name = self.style.FONT_PRIMARY
-            
             # Issuer and date (right-aligned)
             details = f"{cert.get('issuer', '')} | {cert.get('date', '')}"
-            details_run = para.add_run(f"\t{details}")
-            details_run.font.size = self.style.SMALL_SIZE
-            details_run.font.name = self.style.FONT_PRIMARY
-            details_run.font.color.rgb = self.style.COLOR_SECONDARY
+            self._add_paragraph(
+                "certification",
+                # Certification name (bold)
+                self._run_xml(cert['name'], "OR_ContentBold"),
+                self._run_xml(f"\t{details}", "OR_Small"),
+            )
     
     def _add_bullet_point(self, text: str):
         """Add a bullet point with proper formatting."""
-        para = self.doc.add_paragraph()
-        para.paragraph_format.left_indent = Inches(0.25)
-        para.paragraph_format.space_after = Pt(1)
-        
-        # Add bullet character
-        bullet_run = para.add_run("• ")
-        bullet_run.font.size = self.style.CONTENT_SIZE
-        bullet_run.font.name = self.style.FONT_PRIMARY
-        
-        # Add text
-        text_run = para.add_run(text)
-        text_run.font.size = self.style.CONTENT_SIZE
-        text_run.font.name = self.style.FONT_PRIMARY
+        self._body_xml.append(self._bullet_template % self._text_xml(text))
     
     def generate(self, data: dict) -> Document:
         """Generate complete resume from data dictionary."""
         # Header
         self.add_header(data['personal_info'])
         
-        # Summary
-        if data.get('professional_summary'):
-            self.add_summary(data['professional_summary'])
-        
-        # Experience
-        if data.get('work_experiences'):
-            self.add_experience(data['work_experiences'])
-        
-        # Education
-        if data.get('education'):
-            self.add_education(data['education'])
-        
-        # Projects
-        if data.get('projects'):
-            self.add_projects(data['projects'])
-        
-        # Skills
-        if data.get('skills'):
-            self.add_skills(data['skills'])
-        
-        # Certifications
-        if data.get('certifications'):
-            self.add_certifications(data['certifications'])
+        # Optional sections, in document order
+        for key, method_name in self._SECTIONS:
+            section_data = data.get(key)
+            if section_data:
+                getattr(self, method_name)(section_data)
         
+        self._flush_body()
         return self.doc
     
     def save(self, filepath: str):
         """Save document to file."""
+        self._flush_body()
         self.doc.save(filepath)
-        print(f"✅ Resume saved to: {filepath}")
+        logger.info("Resume saved to: %s", filepath)
+    
+    def save_async(self, filepath: str) -> Future:
+        """
+        Save document to file on a background thread.
+        
+        The document must not be modified until the future completes.
+        
+        Args:
+            filepath: Destination .docx path
+            
+        Returns:
+            Future that resolves once the file is written
+        """
+        return _SAVE_EXECUTOR.submit(self.save, filepath)
+
+
+# ============================================================
+# BATCH GENERATION
+# ============================================================
+
+def generate_resume(data: dict, output_path: str) -> str:
+    """
+    Generate one resume and save it.
+    
+    Args:
+        data: Resume data dictionary (see SAMPLE_RESUME)
+        output_path: Destination .docx path
+        
+    Returns:
+        output_path, once written
+    """
+    generator = OpenResumeStyleGenerator()
+    generator.generate(data)
+    generator.save(output_path)
+    return output_path
+
+
+def _warm_template():
+    """Process pool initializer: build the shared template once per worker."""
+    OpenResumeStyleGenerator()
+
+
+def generate_batch(items: list, workers: int = None) -> list:
+    """
+    Generate many resumes in parallel worker processes.
+    
+    Args:
+        items: (data, output_path) pairs
+        workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        Output paths, in the order of items
+    """
+    if not items:
+        return []
+    
+    # Build the template before forking so workers inherit it; the
+    # initializer covers start methods that don't fork
+    _warm_template()
+    data_list, paths = zip(*items)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_template) as pool:
+        return list(pool.map(generate_resume, data_list, paths))
 
 
 # ============================================================
@@ -544,6 +662,7 @@ if __name__ == "__main__":
     # Save to file
     output_path = "test_resume.docx"
     generator.save(output_path)
+    print(f"✅ Resume saved to: {output_path}")
     
     print("\n📄 Open the file in Microsoft Word or Google Docs to view.")
     print("📋 The formatting should match Open-Resume's style:")